@@ -27,16 +27,20 @@ from alpaca.data.historical.stock import StockHistoricalDataClient, StockBarsReq
 from alpaca.data.historical.option import OptionHistoricalDataClient, OptionBarsRequest
 from alpaca.data.timeframe import TimeFrame
 
-# Configure logging to write to file and console
-log_file = os.getenv('BACKTEST_LOG', 'backtest.log')
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s %(levelname)s %(message)s",
-    handlers=[
-        logging.FileHandler(log_file, mode='w'),
-        logging.StreamHandler()
-    ]
-)
+
+def configure_logging():
+    """
+    Configure logging to write to file and console.
+    """
+    log_file = os.getenv('BACKTEST_LOG', 'backtest.log')
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s %(levelname)s %(message)s",
+        handlers=[
+            logging.FileHandler(log_file, mode='w'),
+            logging.StreamHandler()
+        ]
+    )
 
 def get_bars(client, ticker: str, start: datetime, end: datetime):
     """
@@ -74,11 +78,14 @@ def run_backtest(
     base_url: str,
     data_url: str,
     iv_threshold: float,
-    results_file: str = "backtest_results.csv"
+    results_file: str = "backtest_results.csv",
+    bars_cache: dict = None
 ):
     """
     Run a backtest dry-run over the given date range.
     Writes results to backtest_results.csv and prints summary.
+    If bars_cache is given, fetched bars are stored in it keyed by
+    (ticker, start_date, end_date) and reused by later runs sharing the dict.
     """
     # Initialize data client
     url_override = data_url or os.getenv("ALPACA_DATA_BASE_URL") or base_url
@@ -122,8 +129,14 @@ def run_backtest(
 
     records = []
     for ticker in run_tickers:
-        logging.info(f"Fetching bars for {ticker} from {start_date.date()} to {end_date.date()}")
-        bars = get_bars(data_client, ticker, start_date, end_date)
+        cache_key = (ticker, start_date, end_date)
+        if bars_cache is not None and cache_key in bars_cache:
+            bars = bars_cache[cache_key]
+        else:
+            logging.info(f"Fetching bars for {ticker} from {start_date.date()} to {end_date.date()}")
+            bars = get_bars(data_client, ticker, start_date, end_date)
+            if bars_cache is not None:
+                bars_cache[cache_key] = bars
         if len(bars) < 21:
             logging.warning(f"Not enough data for {ticker}: need at least 21 bars, got {len(bars)}")
             continue
@@ -312,7 +325,13 @@ def run_backtest(
     return df
 
 
-if __name__ == '__main__':
+def main(argv=None, bars_cache=None):
+    """
+    Parse CLI args, run the backtest and equity simulation.
+    Returns the net P/L of the simulated equity curve (0.0 if no trades).
+    Importable so sweeps can run backtests in-process instead of via subprocess;
+    pass the same bars_cache dict across calls to fetch each ticker's bars once.
+    """
     parser = argparse.ArgumentParser(description="Backtest options strategy signal generation")
     parser.add_argument("--tickers", required=True,
                         help="Comma-separated list of tickers to backtest")
@@ -326,7 +345,7 @@ if __name__ == '__main__':
     parser.add_argument("--results-file", default="backtest_results.csv", help="Path to write backtest results CSV")
 
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Load environment
     load_dotenv()  # loads .env in cwd
@@ -351,8 +370,16 @@ if __name__ == '__main__':
         secret_key=secret_key,
         base_url=base_url,
         data_url=data_url,
-        iv_threshold=args.iv_threshold, results_file=args.results_file
+        iv_threshold=args.iv_threshold, results_file=args.results_file,
+        bars_cache=bars_cache
     )
     # Simulate equity curve from results
+    net_pl = None
     if df is not None and not df.empty:
-        simulate_equity(args.results_file, args.start, args.end, args.initial_capital)
+        net_pl = simulate_equity(args.results_file, args.start, args.end, args.initial_capital)
+    return net_pl or 0.0
+
+
+if __name__ == '__main__':
+    configure_logging()
+    main()
@@ -0,0 +1,65 @@
+import sys
+from enum import IntEnum
+
+
+class Trend(IntEnum):
+    """
+    Price trend vs the 20-day moving average, as labelled by utils.get_trend.
+    """
+    BEARISH = -1
+    NEUTRAL = 0
+    BULLISH = 1
+
+    @property
+    def label(self) -> str:
+        return sys.intern(self.name.lower())
+
+    @classmethod
+    def from_label(cls, label) -> 'Trend':
+        """Map a get_trend label (or a Trend) to its member; unknown labels are NEUTRAL."""
+        if isinstance(label, cls):
+            return label
+        return _TRENDS.get(label, cls.NEUTRAL)
+
+
+class Momentum(IntEnum):
+    """
+    Last-close momentum, as labelled by utils.get_momentum.
+    """
+    NEGATIVE = -1
+    NEUTRAL = 0
+    POSITIVE = 1
+
+    @property
+    def label(self) -> str:
+        return sys.intern(self.name.lower())
+
+    @classmethod
+    def from_label(cls, label) -> 'Momentum':
+        """Map a get_momentum label (or a Momentum) to its member; unknown labels are NEUTRAL."""
+        if isinstance(label, cls):
+            return label
+        return _MOMENTA.get(label, cls.NEUTRAL)
+
+
+class OptType(IntEnum):
+    """
+    Option contract type. The value indexes the OCC type letter in 'CP'.
+    """
+    CALL = 0
+    PUT = 1
+
+    @property
+    def label(self) -> str:
+        return sys.intern(self.name.lower())
+
+    # Log lines and f-strings keep reading 'call'/'put' rather than 0/1
+    def __str__(self) -> str:
+        return self.label
+
+    def __format__(self, spec) -> str:
+        return format(self.label, spec)
+
+
+_TRENDS = {member.label: member for member in Trend}
+_MOMENTA = {member.label: member for member in Momentum}
@@ -22,8 +22,9 @@ ENABLE_SCANNING = os.getenv('ENABLE_SCANNING', 'false').lower() in ('true', '1')
 from logging.handlers import TimedRotatingFileHandler
 from zoneinfo import ZoneInfo
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.executors.pool import ThreadPoolExecutor
 
-from utils import get_market_data, get_iv, get_trend, get_momentum, get_next_friday
+from utils import get_market_data, get_iv, get_trend, get_momentum, get_next_friday, format_option_symbol, today_cached
 from time_filter import TimeFilter
 from scanner import Scanner
 from risk_manager import RiskManager
@@ -105,11 +106,14 @@ async def scheduled_run(selector, executor, api_key, secret_key, base_url, ticke
         market_data = {}
 
 
+    # One date for the whole pass: expirations and 0DTE checks agree across symbols
+    today = today_cached()
     for symbol, data in market_data.items():
         symbols_processed += 1
         try:
             data['ticker'] = symbol
-            data['expiration'] = get_next_friday()
+            data['today'] = today
+            data['expiration'] = get_next_friday(today)
             iv = get_iv(data)
             trend = get_trend(data)
             momentum = get_momentum(data)
@@ -194,7 +198,16 @@ async def event_loop(selector, executor, api_key, secret_key, base_url, tickers)
     """Set up AsyncIO scheduler and run the WebSocket listener."""
     tz = ZoneInfo('America/New_York')
     scheduler = AsyncIOScheduler(timezone=tz)
+    # SMTP delivery blocks (connect, TLS and retry back-off); give it its own thread
+    # so a slow mail server never stalls the event loop
+    scheduler.add_executor(ThreadPoolExecutor(max_workers=1), alias='smtp')
 
+    # session start: drop yesterday's memoized option symbols
+    scheduler.add_job(
+        format_option_symbol.cache_clear,
+        'cron',
+        day_of_week='mon-fri', hour=9, minute=25
+    )
     # market open: 9:30-9:59 ET
     scheduler.add_job(
         scheduled_run,
@@ -220,7 +233,8 @@ async def event_loop(selector, executor, api_key, secret_key, base_url, tickers)
     scheduler.add_job(
         summary_manager.send_summary_email,
         'cron',
-        day_of_week='mon-fri', hour=16, minute=0
+        day_of_week='mon-fri', hour=16, minute=0,
+        executor='smtp'
     )
 
     scheduler.start()
@@ -3,6 +3,7 @@ import logging
 from typing import List, Dict
 from joblib import load
 from datetime import date
+from utils import today_cached
 
 class ModelManager:
     """
@@ -32,19 +33,7 @@ class ModelManager:
         if not self.model:
             return orders
         # Feature engineering
-        iv = data.get("iv", 0.0)
-        trend_map = {"bullish": 1, "neutral": 0, "bearish": -1}
-        momentum_map = {"positive": 1, "neutral": 0, "negative": -1}
-        trend_score = trend_map.get(data.get("trend"), 0)
-        momentum_score = momentum_map.get(data.get("momentum"), 0)
-        price = data.get("price", 0.0)
-        expiration = data.get("expiration")
-        # Days to expiration
-        try:
-            days_to_exp = (expiration - date.today()).days if isinstance(expiration, date) else 0
-        except Exception:
-            days_to_exp = 0
-        features = [iv, trend_score, momentum_score, price, days_to_exp]
+        features = self.extract_features(data)
         # Model inference
         try:
             proba = self.model.predict_proba([features])[0][1]
@@ -75,7 +64,7 @@ class ModelManager:
         price = data.get("price", 0.0)
         expiration = data.get("expiration")
         try:
-            days_to_exp = (expiration - date.today()).days if isinstance(expiration, date) else 0
+            days_to_exp = (expiration - today_cached()).days if isinstance(expiration, date) else 0
         except Exception:
             days_to_exp = 0
         return [iv, trend_score, momentum_score, price, days_to_exp]
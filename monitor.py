@@ -9,6 +9,14 @@ from dotenv import load_dotenv
 from pythonjsonlogger import jsonlogger
 from alpaca.trading.stream import TradingStream
 
+try:
+    import uvloop
+except ImportError:  # optional: fall back to the default asyncio loop
+    uvloop = None
+
+# Max trade updates buffered for logging before new ones are dropped
+UPDATE_QUEUE_SIZE = int(os.getenv('MONITOR_QUEUE_SIZE', '1024'))
+
 
 def configure_logging():
     """
@@ -43,18 +51,47 @@ async def main():
         url_override=base_url
     )
 
+    # Buffer updates so the WebSocket callback returns without formatting logs
+    update_queue = asyncio.Queue(maxsize=UPDATE_QUEUE_SIZE)
+    dropped = 0
+
     @stream.subscribe_trade_updates
     async def on_trade_update(update):
         # update is a TradeUpdate object
-        logging.info(f"Trade update received: {update}")
+        nonlocal dropped
+        try:
+            update_queue.put_nowait(update)
+        except asyncio.QueueFull:
+            dropped += 1
 
+    drain_task = asyncio.create_task(drain_updates(update_queue, lambda: dropped))
     logging.info('Starting trade updates stream (paper trading)')
     # Run the WebSocket listener until killed
-    await stream._run_forever()
+    try:
+        await stream._run_forever()
+    finally:
+        drain_task.cancel()
+
+
+async def drain_updates(update_queue, dropped_count):
+    """
+    Log trade updates from the queue, reporting any dropped due to backpressure.
+    """
+    reported = 0
+    while True:
+        update = await update_queue.get()
+        dropped = dropped_count()
+        if dropped > reported:
+            logging.warning('Dropped %d trade updates (queue full)', dropped - reported)
+            reported = dropped
+        logging.info('Trade update received: %s', update)
+        update_queue.task_done()
 
 
 if __name__ == '__main__':
     configure_logging()
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -6,6 +6,7 @@ import requests
 import datetime
 from typing import Dict, List
 from textblob import TextBlob
+from utils import today_cached
 
 
 class NewsManager:
@@ -42,6 +43,9 @@ class NewsManager:
         # Cache calendar events by date
         self.calendar_events: List[Dict] = []
         self._last_event_fetch_date = None
+        # News query window (from, to) ISO dates, recomputed once per day
+        self._news_window = None
+        self._news_window_date = None
 
     def _fetch_calendar_events(self):
         """
@@ -50,7 +54,7 @@ class NewsManager:
         if not self.fmp_api_key:
             self.calendar_events = []
             return
-        today = datetime.date.today()
+        today = today_cached()
         if self._last_event_fetch_date == today:
             return
         from_date = today.isoformat()
@@ -84,15 +88,24 @@ class NewsManager:
                 return True
         return False
 
+    def _get_news_window(self):
+        """
+        Return the (from, to) ISO dates for news queries, computed once per day.
+        """
+        today = today_cached()
+        if self._news_window_date != today:
+            from_date = (today - datetime.timedelta(days=self.news_window_days)).isoformat()
+            self._news_window = (from_date, today.isoformat())
+            self._news_window_date = today
+        return self._news_window
+
     def _fetch_news(self, symbol: str) -> List[Dict]:
         """
         Fetch recent company news from Finnhub for the past `news_window_days` days.
         """
         if not self.finnhub_api_key:
             return []
-        today = datetime.date.today()
-        from_date = (today - datetime.timedelta(days=self.news_window_days)).isoformat()
-        to_date = today.isoformat()
+        from_date, to_date = self._get_news_window()
         url = (
             f"https://finnhub.io/api/v1/company-news?symbol={symbol}"
             f"&from={from_date}&to={to_date}&token={self.finnhub_api_key}"
@@ -1,6 +1,29 @@
 import logging
+import numpy as np
 from typing import List, Dict
-from alpaca.trading.requests import StopLossRequest, TakeProfitRequest
+
+def compute_stops(closes, period, side_is_buy, price, sl_mult, tp_mult, sl_pct, tp_pct):
+    """
+    Compute unrounded (stop_price, profit_price, atr) for a single order.
+
+    ATR is the mean absolute close-to-close change over the last `period` bars and is
+    only used when a multiplier is set and enough closes are available; otherwise atr
+    is None and the static percentage stops apply.
+    """
+    atr = None
+    if sl_mult > 0 or tp_mult > 0:
+        closes = np.asarray(closes, dtype=np.float64)
+        if period > 0 and closes.size > period:
+            atr = float(np.abs(np.diff(closes[-(period + 1):])).mean())
+    direction = 1.0 if side_is_buy else -1.0
+    if atr is not None:
+        stop_price = price - direction * sl_mult * atr
+        profit_price = price + direction * tp_mult * atr
+    else:
+        stop_price = price * (1 - direction * sl_pct)
+        profit_price = price * (1 + direction * tp_pct)
+    return stop_price, profit_price, atr
+
 
 class RiskManager:
     """
@@ -47,36 +70,18 @@ class RiskManager:
         price = data.get('price') or 0.0
         side = order.get('side', '').lower()
 
-        # Compute ATR if multipliers specified
-        close_prices = data.get('close_prices', [])
-        atr = None
-        if (self.atr_stop_multiplier > 0 or self.atr_take_profit_multiplier > 0) and len(close_prices) > self.atr_period:
-            diffs = [abs(close_prices[i] - close_prices[i-1]) for i in range(1, len(close_prices))]
-            recent = diffs[-self.atr_period:]
-            if recent:
-                atr = sum(recent) / len(recent)
-
-        # Determine stop-loss and take-profit
-        if atr is not None:
-            # ATR-based dynamic stops
-            if side == 'buy':
-                stop_price = round(price - self.atr_stop_multiplier * atr, 2)
-                profit_price = round(price + self.atr_take_profit_multiplier * atr, 2)
-            else:
-                stop_price = round(price + self.atr_stop_multiplier * atr, 2)
-                profit_price = round(price - self.atr_take_profit_multiplier * atr, 2)
-        else:
-            # Static percentage-based stops
-            if side == 'buy':
-                stop_price = round(price * (1 - self.stop_loss_pct), 2)
-                profit_price = round(price * (1 + self.take_profit_pct), 2)
-            else:
-                stop_price = round(price * (1 + self.stop_loss_pct), 2)
-                profit_price = round(price * (1 - self.take_profit_pct), 2)
+        # Determine stop-loss and take-profit (ATR-based when multipliers are set)
+        stop_price, profit_price, _ = compute_stops(
+            data.get('close_prices', []), self.atr_period, side == 'buy', price,
+            self.atr_stop_multiplier, self.atr_take_profit_multiplier,
+            self.stop_loss_pct, self.take_profit_pct
+        )
+        stop_price = round(stop_price, 2)
+        profit_price = round(profit_price, 2)
 
-        # Attach StopLoss and TakeProfit requests
-        order['stop_loss'] = StopLossRequest(stop_price=stop_price)
-        order['take_profit'] = TakeProfitRequest(limit_price=profit_price)
+        # Attach plain stop-loss/take-profit prices for downstream handling
+        order['stop_loss_price'] = stop_price
+        order['take_profit_price'] = profit_price
 
         # Trailing stop flag for downstream handling
         if self.trailing_stop_pct and side:
@@ -1,11 +1,17 @@
 import os
+import sys
 import logging
 import time
 import json
+import numpy as np
 
 from alpaca.trading.client import TradingClient
 from utils import get_market_data, get_iv, get_trend, get_momentum
 
+# Signals a symbol must show to pass the scan
+_BULLISH = sys.intern('bullish')
+_POSITIVE = sys.intern('positive')
+
 class Scanner:
     '''
     Dynamic scanning and sector analysis module.
@@ -36,34 +42,39 @@ class Scanner:
         )
 
     def _load_cache(self):
-        if os.path.exists(self.cache_file):
-            try:
-                with open(self.cache_file, 'r') as f:
-                    cache = json.load(f)
-                ts = cache.get('timestamp', 0)
-                if time.time() - ts < self.cache_ttl:
-                    return cache.get('tickers', [])
-            except Exception as e:
-                logging.warning(f'Cache load failed: {e}')
+        try:
+            # TTL is checked against the file mtime so stale caches are never parsed
+            if time.time() - os.stat(self.cache_file).st_mtime >= self.cache_ttl:
+                return None
+            with open(self.cache_file, 'r') as f:
+                cache = json.load(f)
+            return cache.get('tickers', [])
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.warning('Cache load failed: %s', e)
         return None
 
     def _save_cache(self, tickers):
+        tmp_file = self.cache_file + '.tmp'
         try:
-            with open(self.cache_file, 'w') as f:
+            with open(tmp_file, 'w') as f:
                 json.dump({'timestamp': time.time(), 'tickers': tickers}, f)
+            # Atomic swap so concurrent readers never see a partial file
+            os.replace(tmp_file, self.cache_file)
         except Exception as e:
-            logging.warning(f'Cache save failed: {e}')
+            logging.warning('Cache save failed: %s', e)
 
     def scan(self):
         override = os.getenv('TICKERS', '')
         if override:
             tickers = [t.strip().upper() for t in override.split(',') if t.strip()]
-            logging.info(f'Scanner using override tickers: {tickers}')
+            logging.info('Scanner using override tickers: %s', tickers)
             return tickers
 
         cached = self._load_cache()
         if cached is not None:
-            logging.info(f'Scanner using cached tickers: {cached}')
+            logging.info('Scanner using cached tickers: %s', cached)
             return cached
 
         assets = self.trading_client.get_all_assets(status='active', asset_class='us_equity')
@@ -73,17 +84,15 @@ class Scanner:
             return []
 
         data = get_market_data(symbols, self.api_key, self.secret_key, self.base_url, self.data_url)
-        candidates = []
-        for sym, d in data.items():
-            iv = get_iv(d)
-            trend = get_trend(d)
-            momentum = get_momentum(d)
-            if iv > self.max_iv or trend != 'bullish' or momentum != 'positive':
-                continue
-            candidates.append({'symbol': sym, 'iv': iv})
-
-        sorted_c = sorted(candidates, key=lambda x: x['iv'])
-        top = [c['symbol'] for c in sorted_c[:self.top_n]]
-        logging.info(f'Scanner returning top {len(top)} symbols: {top}')
+        syms = list(data.keys())
+        n = len(syms)
+        iv_arr = np.fromiter((get_iv(data[s]) for s in syms), dtype=np.float64, count=n)
+        bullish = np.fromiter((get_trend(data[s]) == _BULLISH for s in syms), dtype=bool, count=n)
+        positive = np.fromiter((get_momentum(data[s]) == _POSITIVE for s in syms), dtype=bool, count=n)
+        # Keep bullish/positive symbols within the IV cap, lowest IV first
+        candidates = np.flatnonzero(~(iv_arr > self.max_iv) & bullish & positive)
+        ranked = candidates[np.argsort(iv_arr[candidates], kind='stable')]
+        top = [syms[i] for i in ranked[:self.top_n]]
+        logging.info('Scanner returning top %d symbols: %s', len(top), top)
         self._save_cache(top)
         return top
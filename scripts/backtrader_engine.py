@@ -1,14 +1,22 @@
 #!/usr/bin/env python3
 import os
 import argparse
+import functools
 from datetime import datetime
 import backtrader as bt
 import pandas as pd
 from dotenv import load_dotenv
 
 from strategy_selector import StrategySelector
+from strategies import STRATEGY_FUNCS
 from model_manager import ModelManager
-from utils import get_iv, get_trend, get_momentum, get_next_friday
+from utils import get_iv, get_trend, get_momentum, get_next_friday, get_rolling_metrics
+
+# Trailing bars used for the IV/trend/momentum metrics
+WINDOW = 20
+
+# Feeds share trading dates, so each date's expiration is computed once
+_next_friday = functools.lru_cache(maxsize=4096)(get_next_friday)
 
 
 class BTOptionsStrategy(bt.Strategy):
@@ -18,20 +26,57 @@ class BTOptionsStrategy(bt.Strategy):
         self.selector = StrategySelector(iv_threshold=self.p.iv_threshold)
         enable_ml = os.getenv("ENABLE_ML", "false").lower() in ("true", "1", "yes")
         self.model_manager = ModelManager() if enable_ml else None
+        self._metrics = {}
+        self._picks = {}
+
+    def start(self):
+        # Feeds are preloaded before the run, so compute every bar's metrics in one pass
+        for data in self.datas:
+            self._metrics[data._name] = get_rolling_metrics(data.close.array, WINDOW)
+        self._precompute_picks()
+
+    def _precompute_picks(self):
+        """
+        Resolve the selected strategy's run function for every bar of every feed up front.
+        Strategy scores depend on IV only through its comparison with the threshold, so
+        selection is run once per distinct (trend, momentum, IV side) and reused.
+        """
+        th = self.p.iv_threshold
+        choices = {}
+        for ticker, (ivs, trends, momenta) in self._metrics.items():
+            picks = []
+            for iv, trend, momentum in zip(ivs, trends, momenta):
+                if iv is None:
+                    picks.append(None)
+                    continue
+                key = (trend, momentum, iv < th, iv >= th)
+                if key not in choices:
+                    name = type(self.selector.select(trend, iv, momentum)).__name__
+                    choices[key] = STRATEGY_FUNCS[name][1]
+                picks.append(choices[key])
+            self._picks[ticker] = picks
 
     def next(self):
         for data in self.datas:
             dt = data.datetime.date(0)
-            closes = list(data.close.get(size=20))
-            if len(closes) < 20:
+            closes = list(data.close.get(size=WINDOW))
+            if len(closes) < WINDOW:
                 continue
             price = data.close[0]
             ticker = data._name
 
-            iv = get_iv({"close_prices": closes})
-            trend = get_trend({"close_prices": closes, "price": price})
-            momentum = get_momentum({"close_prices": closes})
-            expiration = get_next_friday(dt)
+            i = len(data) - 1
+            ivs, trends, momenta = self._metrics.get(ticker, ((), (), ()))
+            picks = self._picks.get(ticker, ())
+            run = picks[i] if i < len(picks) else None
+            if i < len(ivs):
+                iv, trend, momentum = ivs[i], trends[i], momenta[i]
+            else:
+                # Feed was not preloaded: fall back to per-bar computation
+                iv = get_iv({"close_prices": closes})
+                trend = get_trend({"close_prices": closes, "price": price})
+                momentum = get_momentum({"close_prices": closes})
+            expiration = _next_friday(dt)
 
             info = {
                 "ticker": ticker,
@@ -43,8 +88,9 @@ class BTOptionsStrategy(bt.Strategy):
                 "expiration": expiration,
             }
 
-            strat = self.selector.select(trend, iv, momentum)
-            orders = strat.run(info)
+            if run is None:
+                run = self.selector.select(trend, iv, momentum).run
+            orders = run(info)
             if self.model_manager:
                 orders = self.model_manager.adjust_orders(orders, info)
             for o in orders:
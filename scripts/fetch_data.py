@@ -3,10 +3,14 @@
 Fetch historical daily OHLCV data for given tickers from Alpaca and save as CSV files.
 """
 import os
+import shutil
 import argparse
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+import numpy as np
 import pandas as pd
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 from alpaca.data.historical.stock import StockHistoricalDataClient, StockBarsRequest
 from alpaca.data.timeframe import TimeFrame
 
@@ -28,45 +32,143 @@ def fetch_and_save(tickers, start_date, end_date, outdir, url_override=None):
     )
 
     os.makedirs(outdir, exist_ok=True)
-    for ticker in tickers:
-        print(f"Fetching {ticker} from {start_date.date()} to {end_date.date()}...")
-        req = StockBarsRequest(
-            symbol_or_symbols=ticker,
-            timeframe=TimeFrame.Day,
-            start=start_date,
-            end=end_date
-        )
-        resp = client.get_stock_bars(req)
-        # normalize response
-        if hasattr(resp, 'data'):
-            data_map = resp.data
-        elif isinstance(resp, dict):
-            data_map = resp
-        else:
-            data_map = {}
-
-        bars = data_map.get(ticker, [])
-        if not bars:
-            print(f"No data returned for {ticker}")
-            continue
-
-        # Build DataFrame
-        rows = []
-        for bar in bars:
-            rows.append({
-                'Date': bar.t.strftime('%Y-%m-%d'),
-                'Open': bar.o,
-                'High': bar.h,
-                'Low': bar.l,
-                'Close': bar.c,
-                'Volume': bar.v
-            })
-        df = pd.DataFrame(rows)
-        df.set_index('Date', inplace=True)
-
-        out_path = os.path.join(outdir, f"{ticker}.csv")
-        df.to_csv(out_path)
-        print(f"Saved {out_path} ({len(df)} bars)")
+    # Downloads are network-bound, so overlap them across a small thread pool
+    workers = max(1, int(os.getenv('FETCH_WORKERS', '8')))
+    _size_connection_pool(client, workers)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(fetch_ticker, client, ticker, start_date, end_date, outdir): ticker
+            for ticker in tickers
+        }
+        # Handle tickers as they finish so one failure does not abort the rest
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                print(f"Failed to fetch {futures[future]}: {e}")
+
+
+def _size_connection_pool(client, size):
+    """
+    Mount a connection pool of `size` on the client's requests session so concurrent
+    fetches reuse keep-alive connections instead of opening new TLS sessions.
+    Rate-limit retries are left to the SDK, which already retries 429/504 responses.
+    """
+    session = getattr(client, '_session', None)
+    if session is None:
+        return
+    adapter = HTTPAdapter(pool_connections=size, pool_maxsize=size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+
+
+def fetch_ticker(client, ticker, start_date, end_date, outdir):
+    """
+    Fetch daily bars for one ticker and write them to {outdir}/{ticker}.csv.
+
+    Downloads are cached per (ticker, start, end) as {outdir}/{ticker}_{start}_{end}.csv;
+    a valid cached file is reused without calling the API unless FETCH_FORCE_REFRESH is set.
+    Ranges ending today or later are still filling in, so they are never cached.
+    """
+    out_path = os.path.join(outdir, f"{ticker}.csv")
+    cache_path = os.path.join(outdir, f"{ticker}_{start_date.date()}_{end_date.date()}.csv")
+    cacheable = end_date.date() < date.today()
+    force_refresh = os.getenv('FETCH_FORCE_REFRESH', 'false').lower() in ('true', '1')
+    if cacheable and not force_refresh and _is_valid_cache(cache_path, start_date, end_date):
+        _copy_atomic(cache_path, out_path)
+        print(f"Cache hit for {ticker}: {cache_path}")
+        return
+
+    print(f"Fetching {ticker} from {start_date.date()} to {end_date.date()}...")
+    req = StockBarsRequest(
+        symbol_or_symbols=ticker,
+        timeframe=TimeFrame.Day,
+        start=start_date,
+        end=end_date
+    )
+    resp = client.get_stock_bars(req)
+    # normalize response
+    if hasattr(resp, 'data'):
+        data_map = resp.data
+    elif isinstance(resp, dict):
+        data_map = resp
+    else:
+        data_map = {}
+
+    bars = data_map.get(ticker, [])
+    if not bars:
+        print(f"No data returned for {ticker}")
+        return
+
+    # Fill preallocated column buffers in one pass; dates are formatted in one vectorized pass
+    n = len(bars)
+    timestamps = np.empty(n, dtype=object)
+    opens = np.empty(n, dtype=np.float64)
+    highs = np.empty(n, dtype=np.float64)
+    lows = np.empty(n, dtype=np.float64)
+    closes = np.empty(n, dtype=np.float64)
+    volumes = np.empty(n, dtype=np.float64)
+    for i, bar in enumerate(bars):
+        timestamps[i] = bar.timestamp
+        opens[i] = bar.open
+        highs[i] = bar.high
+        lows[i] = bar.low
+        closes[i] = bar.close
+        volumes[i] = bar.volume
+    dates = pd.to_datetime(timestamps).strftime('%Y-%m-%d')
+    df = pd.DataFrame({
+        'Open': opens,
+        'High': highs,
+        'Low': lows,
+        'Close': closes,
+        'Volume': volumes,
+    }, index=pd.Index(dates, name='Date'))
+
+    if cacheable:
+        _write_csv_atomic(df, cache_path)
+        _copy_atomic(cache_path, out_path)
+    else:
+        _write_csv_atomic(df, out_path)
+    print(f"Saved {out_path} ({len(df)} bars)")
+
+
+def _write_csv_atomic(df, path):
+    """Write df to path via a .tmp file and os.replace, so a crash never leaves a truncated CSV."""
+    tmp_path = path + '.tmp'
+    df.to_csv(tmp_path)
+    os.replace(tmp_path, path)
+
+
+def _copy_atomic(src, dst):
+    """Copy src to dst via a .tmp file and os.replace."""
+    tmp_path = dst + '.tmp'
+    shutil.copyfile(src, tmp_path)
+    os.replace(tmp_path, dst)
+
+
+# Largest gap between a range edge and the nearest trading day (long weekend plus a holiday)
+_EDGE_SLACK = timedelta(days=4)
+
+
+def _is_valid_cache(cache_path, start_date, end_date):
+    """
+    Return True if cache_path is a non-empty CSV whose dates fall in the requested range
+    and reach both of its ends, allowing for weekends and holidays at the edges.
+    """
+    if not os.path.exists(cache_path) or os.path.getsize(cache_path) == 0:
+        return False
+    with open(cache_path) as f:
+        lines = f.read().splitlines()
+    if len(lines) < 2:
+        return False
+    first = lines[1].split(',', 1)[0]
+    last = lines[-1].split(',', 1)[0]
+    start, end = start_date.date(), end_date.date()
+    if not start.isoformat() <= first <= last <= end.isoformat():
+        return False
+    # A file that stops short of either end only covers part of the range
+    return (first <= (start + _EDGE_SLACK).isoformat()
+            and last >= (end - _EDGE_SLACK).isoformat())
 
 
 def main():
@@ -4,34 +4,67 @@ Simulate an equity curve from backtest_results.csv for a given calendar year.
 Usage:
     python simulate_equity.py --start 2024-01-01 --end 2025-01-01 --initial-capital 100000
 """
+import os
 import argparse
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
+_results_cache = {}
+
+def _load_sorted_results(csv_path):
+    """
+    Read a results CSV and sort it by entry_date, reusing the parsed frame while the
+    file is unchanged so sweeps over several windows only parse it once. The size is
+    part of the key so a rewrite within the mtime resolution still invalidates it.
+    """
+    st = os.stat(csv_path)
+    key = (os.path.abspath(csv_path), st.st_mtime_ns, st.st_size)
+    df = _results_cache.get(key)
+    if df is None:
+        # Only the columns the equity curve needs are parsed
+        df = pd.read_csv(csv_path, usecols=["entry_date", "expiration", "pl"],
+                         parse_dates=["entry_date", "expiration"])
+        df = df.sort_values("entry_date", kind="stable").reset_index(drop=True)
+        _results_cache.clear()
+        _results_cache[key] = df
+    return df
+
 def simulate_equity(csv_path, start_date, end_date, initial_capital):
-    # Load detailed trade results
-    df = pd.read_csv(csv_path, parse_dates=["entry_date", "expiration"])
+    """
+    Build and plot the equity curve for trades entered in [start_date, end_date).
+    Returns the net P/L over the period.
+    """
+    # Load detailed trade results, sorted by entry_date
+    df = _load_sorted_results(csv_path)
 
-    # Filter by entry_date window
-    mask = (df["entry_date"] >= pd.to_datetime(start_date)) & \
-           (df["entry_date"] <  pd.to_datetime(end_date))
-    df = df.loc[mask].copy()
+    # Select the entry_date window by binary search over the sorted dates
+    entry_dates = df["entry_date"].values
+    lo = np.searchsorted(entry_dates, np.datetime64(pd.to_datetime(start_date)), side='left')
+    hi = np.searchsorted(entry_dates, np.datetime64(pd.to_datetime(end_date)), side='left')
+    df = df.iloc[lo:hi].copy()
     if df.empty:
         print(f"No trades found between {start_date} and {end_date}.")
-        return
+        return 0.0
 
     # Use expiration date as P/L realization date
     df["pl_date"] = pd.to_datetime(df["expiration"]).dt.date
 
-    # Ensure P/L is numeric; missing => 0
-    df["pl"] = pd.to_numeric(df["pl"], errors="coerce").fillna(0.0)
+    # P/L as float; missing => 0
+    pl = np.nan_to_num(df["pl"].to_numpy(dtype=np.float64))
 
-    # Sum daily P/L
-    daily_pl = df.groupby("pl_date")["pl"].sum().sort_index()
+    # Sum daily P/L over sorted date codes. Per-bar summary rows have no expiration,
+    # so their NaT pl_date factorizes to -1; drop them as groupby would
+    codes, unique_dates = pd.factorize(df["pl_date"].values, sort=True)
+    realized = codes >= 0
+    if not realized.any():
+        print(f"No realized P/L between {start_date} and {end_date}.")
+        return 0.0
+    daily_pl = np.bincount(codes[realized], weights=pl[realized], minlength=len(unique_dates))
 
     # Build equity series
-    equity = daily_pl.cumsum().add(initial_capital)
-    equity.index = pd.to_datetime(equity.index)
+    equity = pd.Series(np.cumsum(daily_pl) + initial_capital,
+                       index=pd.to_datetime(unique_dates))
 
     # Print summary
     start_eq = initial_capital
@@ -53,7 +86,10 @@ def simulate_equity(csv_path, start_date, end_date, initial_capital):
     out_png = f"equity_curve_{start_date}_to_{end_date}.png"
     plt.tight_layout()
     plt.savefig(out_png)
+    # Release the figure so repeated in-process calls don't accumulate open figures
+    plt.close()
     print(f"Equity curve saved to {out_png}")
+    return net_pl
 
 if __name__ == '__main__':
     p = argparse.ArgumentParser(description="Simulate portfolio equity from a backtest CSV.")
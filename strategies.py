@@ -1,202 +1,266 @@
+import sys
 import logging
 from typing import List, Dict, Any
-from utils import format_option_symbol
+from utils import format_option_symbol, build_occ_root, occ_symbol, today_cached
 from datetime import date, timedelta
+from operator import itemgetter
+import numpy as np
+from enums import Trend, Momentum, OptType
+
+logger = logging.getLogger(__name__)
+
+def encode_batch(rows: List[Dict[str, Any]], iv_threshold: float = 0.25) -> Dict[str, np.ndarray]:
+    """
+    Convert a list of metric dicts into the column arrays accepted by score_batch:
+    int8 'trend'/'momentum' codes and float64 'iv'/'iv_threshold'.
+    Labels may be strings or Trend/Momentum members; unknown labels encode as neutral (0).
+    """
+    n = len(rows)
+    return {
+        'trend': np.fromiter((Trend.from_label(r.get('trend')) for r in rows), dtype=np.int8, count=n),
+        'momentum': np.fromiter((Momentum.from_label(r.get('momentum')) for r in rows), dtype=np.int8, count=n),
+        'iv': np.fromiter((r.get('iv', 0.0) for r in rows), dtype=np.float64, count=n),
+        'iv_threshold': np.fromiter((r.get('iv_threshold', iv_threshold) for r in rows), dtype=np.float64, count=n),
+    }
+
+# Leg vocabulary shared by the templates, leg tables and run() methods: interned
+# side strings (they go on the wire) and OptType members (they index the OCC letter)
+BUY, SELL = sys.intern('buy'), sys.intern('sell')
+CALL, PUT = OptType.CALL, OptType.PUT
+
+# Shared leg layout; _build_order() copies it and fills in symbol and side
+_ORDER_TEMPLATE = {
+    'symbol': None, 'qty': 1, 'side': BUY,
+    'type': sys.intern('market'), 'time_in_force': sys.intern('day'),
+}
+
+# Fields every run() reads, extracted in one C-level call
+_RUN_FIELDS = itemgetter('ticker', 'price', 'expiration')
+
+def _atm_strike(price) -> int:
+    """ATM strike for every run(): nearest whole dollar, with .5 ties rounding up."""
+    return int(price + 0.5)
+
+def _build_order(symbol, side) -> Dict[str, Any]:
+    """Copy the order template for one leg with its symbol and side filled in."""
+    order = _ORDER_TEMPLATE.copy()
+    order['symbol'] = symbol
+    order['side'] = side
+    return order
+
+def _single_leg(ticker, expiration, strike, opt_type, side=BUY) -> Dict[str, Any]:
+    """Build one market order leg for a single option contract."""
+    return _build_order(format_option_symbol(ticker, expiration, strike, opt_type), side)
 
 class Strategy:
+    __slots__ = ()
     phase = 1
     """
     Base class for options trading strategies.
     """
-    @classmethod
-    def score(cls, data: Dict[str, Any]) -> float:
+    @staticmethod
+    def score(data: Dict[str, Any]) -> float:
         """Default scoring method: override in subclasses."""
         return 0.0
 
+    @classmethod
+    def score_batch(cls, batch: Dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Score many tickers at once from encode_batch() columns.
+        Default: decode each row and call score(); subclasses override with array arithmetic.
+        """
+        return np.array([
+            cls.score({
+                'trend': Trend(int(t)).label,
+                'momentum': Momentum(int(m)).label,
+                'iv': float(iv),
+                'iv_threshold': float(th),
+            })
+            for t, m, iv, th in zip(batch['trend'], batch['momentum'], batch['iv'], batch['iv_threshold'])
+        ])
+
+    @classmethod
+    def leg_count(cls, data: Dict[str, Any]) -> int:
+        """
+        Number of orders run(data) returns when its strikes are valid.
+        Used by the selector's tie-break; subclasses answer from their entry
+        conditions without building orders.
+        """
+        return len(cls().run(data))
+
     def run(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Given market data and metrics, returns list of order parameter dicts.
         """
         raise NotImplementedError
 
+def _materialize_legs(name, ticker, expiration, atm, legs, all_or_nothing=True) -> List[Dict[str, Any]]:
+    """
+    Build market orders for (strike offset from atm, opt_type, side) legs sharing one
+    expiration; this is the only strike validation the multi-leg run()s need.
+    A non-positive strike is logged; with all_or_nothing (the default) the whole
+    structure is rejected, otherwise only that leg is skipped.
+    """
+    valid = [leg for leg in legs if atm + leg[0] > 0]
+    if len(valid) < len(legs):
+        for offset, _, _ in legs:
+            if atm + offset <= 0:
+                logger.error("Invalid strike for %s: %s", name, atm + offset)
+        if all_or_nothing:
+            return []
+    root = build_occ_root(ticker, expiration)
+    orders = [_build_order(occ_symbol(root, atm + offset, opt_type), side) for offset, opt_type, side in valid]
+    if logger.isEnabledFor(logging.INFO):
+        for (_, opt_type, side), order in zip(valid, orders):
+            logger.info("%s leg %s %s: %s", name, opt_type, side, order)
+    return orders
+
 class LongCall(Strategy):
-    @classmethod
-    def score(cls, data: Dict[str, Any]) -> float:
+    __slots__ = ()
+
+    @staticmethod
+    def score(data: Dict[str, Any]) -> float:
         trend = data['trend']
         iv = data['iv']
         momentum = data['momentum']
         iv_th = data['iv_threshold']
-        score = 0
-        if trend == 'bullish' and momentum == 'positive':
-            score += 2
-        if iv < iv_th:
-            score += 1
-        return score
+        return int(2 * (trend == 'bullish' and momentum == 'positive') + (iv < iv_th))
+
+    @classmethod
+    def score_batch(cls, batch: Dict[str, np.ndarray]) -> np.ndarray:
+        aligned = (batch['trend'] == 1) & (batch['momentum'] == 1)
+        return aligned * 2 + (batch['iv'] < batch['iv_threshold'])
+
+    @staticmethod
+    def leg_count(data: Dict[str, Any]) -> int:
+        return 1
 
     def run(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        ticker = data['ticker']
-        price = data['price']
-        expiration = data['expiration']  # type: date
-        strike = round(price)
-        symbol = format_option_symbol(ticker, expiration, strike, 'call')
-        order = {
-            'symbol': symbol,
-            'qty': 1,
-            'side': 'buy',
-            'type': 'market',
-            'time_in_force': 'day'
-        }
-        logging.info(f"LongCall: {order}")
+        ticker, price, expiration = _RUN_FIELDS(data)
+        order = _single_leg(ticker, expiration, _atm_strike(price), CALL)
+        logger.info("LongCall: %s", order)
         return [order]
 
 class LongPut(Strategy):
-    @classmethod
-    def score(cls, data: Dict[str, Any]) -> float:
+    __slots__ = ()
+
+    @staticmethod
+    def score(data: Dict[str, Any]) -> float:
         trend = data['trend']
         iv = data['iv']
         momentum = data['momentum']
         iv_th = data['iv_threshold']
-        score = 0
-        if trend == 'bearish' and momentum == 'negative':
-            score += 2
-        if iv < iv_th:
-            score += 1
-        return score
+        return int(2 * (trend == 'bearish' and momentum == 'negative') + (iv < iv_th))
+
+    @classmethod
+    def score_batch(cls, batch: Dict[str, np.ndarray]) -> np.ndarray:
+        aligned = (batch['trend'] == -1) & (batch['momentum'] == -1)
+        return aligned * 2 + (batch['iv'] < batch['iv_threshold'])
+
+    @staticmethod
+    def leg_count(data: Dict[str, Any]) -> int:
+        return 1
 
     def run(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        ticker = data['ticker']
-        price = data['price']
-        expiration = data['expiration']  # type: date
-        strike = round(price)
-        symbol = format_option_symbol(ticker, expiration, strike, 'put')
-        order = {
-            'symbol': symbol,
-            'qty': 1,
-            'side': 'buy',
-            'type': 'market',
-            'time_in_force': 'day'
-        }
-        logging.info(f"LongPut: {order}")
+        ticker, price, expiration = _RUN_FIELDS(data)
+        order = _single_leg(ticker, expiration, _atm_strike(price), PUT)
+        logger.info("LongPut: %s", order)
         return [order]
 
 class Straddle(Strategy):
-    @classmethod
-    def score(cls, data: Dict[str, Any]) -> float:
+    __slots__ = ()
+
+    @staticmethod
+    def score(data: Dict[str, Any]) -> float:
         trend = data['trend']
         iv = data['iv']
         iv_th = data['iv_threshold']
-        score = 0
-        if trend == 'neutral':
-            score += 1
-            if iv < iv_th:
-                score += 1
-        return score
+        return int(trend == 'neutral' and 1 + (iv < iv_th))
+
+    @classmethod
+    def score_batch(cls, batch: Dict[str, np.ndarray]) -> np.ndarray:
+        neutral = batch['trend'] == 0
+        return neutral * (1 + (batch['iv'] < batch['iv_threshold']))
+
+    @staticmethod
+    def leg_count(data: Dict[str, Any]) -> int:
+        return 2
 
     def run(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        ticker = data['ticker']
-        price = data['price']
-        expiration = data['expiration']  # type: date
-        strike = round(price)
-        orders = []
-        for opt_type in ['call', 'put']:
-            symbol = format_option_symbol(ticker, expiration, strike, opt_type)
-            order = {
-                'symbol': symbol,
-                'qty': 1,
-                'side': 'buy',
-                'type': 'market',
-                'time_in_force': 'day'
-            }
-            orders.append(order)
-            logging.info(f"Straddle {opt_type}: {order}")
-        return orders
+        ticker, price, expiration = _RUN_FIELDS(data)
+        strike = _atm_strike(price)
+        call = _single_leg(ticker, expiration, strike, CALL)
+        put = _single_leg(ticker, expiration, strike, PUT)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Straddle call: %s", call)
+            logger.info("Straddle put: %s", put)
+        return [call, put]
+
+# IronCondor legs, lowest strike first: (strike offset from ATM, option type, side)
+_IC_LEGS = ((-4, PUT, BUY), (-2, PUT, SELL), (2, CALL, SELL), (4, CALL, BUY))
 
 class IronCondor(Strategy):
-    @classmethod
-    def score(cls, data: Dict[str, Any]) -> float:
+    __slots__ = ()
+
+    @staticmethod
+    def score(data: Dict[str, Any]) -> float:
         trend = data['trend']
         iv = data['iv']
         iv_th = data['iv_threshold']
-        score = 0
-        if trend == 'neutral':
-            score += 1
-            if iv >= iv_th:
-                score += 2
-        return score
+        return int(trend == 'neutral' and 1 + 2 * (iv >= iv_th))
+
+    @classmethod
+    def score_batch(cls, batch: Dict[str, np.ndarray]) -> np.ndarray:
+        neutral = batch['trend'] == 0
+        return neutral * (1 + 2 * (batch['iv'] >= batch['iv_threshold']))
+
+    @staticmethod
+    def leg_count(data: Dict[str, Any]) -> int:
+        return 4
 
     def run(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        ticker = data['ticker']
-        price = data['price']
-        expiration = data['expiration']  # type: date
-        atm = round(price)
-        put_sell = atm - 2
-        put_buy = atm - 4
-        call_sell = atm + 2
-        call_buy = atm + 4
-        for s in [put_buy, put_sell, call_sell, call_buy]:
-            if s <= 0:
-                logging.error("Invalid strike generated for IronCondor")
-                return []
-        orders = []
-        legs = [
-            (put_buy, 'put', 'buy'),
-            (put_sell, 'put', 'sell'),
-            (call_sell, 'call', 'sell'),
-            (call_buy, 'call', 'buy'),
-        ]
-        for strike, opt_type, side in legs:
-            symbol = format_option_symbol(ticker, expiration, strike, opt_type)
-            order = {
-                'symbol': symbol,
-                'qty': 1,
-                'side': side,
-                'type': 'market',
-                'time_in_force': 'day'
-            }
-            orders.append(order)
-            logging.info(f"IronCondor leg {opt_type} {side}: {order}")
-        return orders
+        ticker, price, expiration = _RUN_FIELDS(data)
+        atm = _atm_strike(price)
+        return _materialize_legs('IronCondor', ticker, expiration, atm, _IC_LEGS)
+
+# Leg specs: (strike offset from ATM, option type, side), built once at import
+_VSPREAD_LEGS = {
+    'bullish': ((0, CALL, BUY), (2, CALL, SELL)),
+    'bearish': ((0, PUT, BUY), (-2, PUT, SELL)),
+}
+_VSPREAD_LEGS['neutral'] = _VSPREAD_LEGS['bullish']
+_BULL_CALL_LEGS = _VSPREAD_LEGS['bullish']
+_BEAR_PUT_LEGS = _VSPREAD_LEGS['bearish']
+_GAMMA_LEGS = ((0, CALL, BUY), (0, PUT, BUY))
+_STRANGLE_LEGS = ((-2, PUT, BUY), (2, CALL, BUY))
+_SHORT_STRADDLE_LEGS = ((0, PUT, SELL), (0, CALL, SELL))
+_RATIO_LEGS = {
+    'positive': ((0, CALL, SELL), (2, CALL, BUY), (2, CALL, BUY)),
+    'negative': ((0, PUT, SELL), (-2, PUT, BUY), (-2, PUT, BUY)),
+}
+_COLLAR_LEGS = ((2, CALL, SELL), (-2, PUT, BUY))
 
 class VerticalSpread(Strategy):
-    @classmethod
-    def score(cls, data: Dict[str, Any]) -> float:
+    __slots__ = ()
+
+    @staticmethod
+    def score(data: Dict[str, Any]) -> float:
         # fallback baseline score
         return 0.5
 
+    @classmethod
+    def score_batch(cls, batch: Dict[str, np.ndarray]) -> np.ndarray:
+        return np.full(len(batch['trend']), 0.5)
+
+    @staticmethod
+    def leg_count(data: Dict[str, Any]) -> int:
+        return 2
+
     def run(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        ticker = data['ticker']
-        price = data['price']
-        expiration = data['expiration']  # type: date
-        atm = round(price)
-        trend = data.get('trend', 'neutral')
-        orders = []
-        if trend == 'bullish':
-            buy_strike, sell_strike = atm, atm + 2
-            buy_leg = (buy_strike, 'call', 'buy')
-            sell_leg = (sell_strike, 'call', 'sell')
-        elif trend == 'bearish':
-            buy_strike, sell_strike = atm, atm - 2
-            buy_leg = (buy_strike, 'put', 'buy')
-            sell_leg = (sell_strike, 'put', 'sell')
-        else:
-            buy_strike, sell_strike = atm, atm + 2
-            buy_leg = (buy_strike, 'call', 'buy')
-            sell_leg = (sell_strike, 'call', 'sell')
-        for strike, opt_type, side in [buy_leg, sell_leg]:
-            if strike <= 0:
-                logging.error("Invalid strike for VerticalSpread: %s", strike)
-                continue
-            symbol = format_option_symbol(ticker, expiration, strike, opt_type)
-            order = {
-                'symbol': symbol,
-                'qty': 1,
-                'side': side,
-                'type': 'market',
-                'time_in_force': 'day'
-            }
-            orders.append(order)
-            logging.info(f"VerticalSpread leg {opt_type} {side}: {order}")
-        return orders
+        ticker, price, expiration = _RUN_FIELDS(data)
+        atm = _atm_strike(price)
+        legs = _VSPREAD_LEGS.get(data.get('trend', 'neutral'), _BULL_CALL_LEGS)
+        return _materialize_legs('VerticalSpread', ticker, expiration, atm, legs, all_or_nothing=False)
 
 # Phase-2 strategy stubs
 
@@ -205,9 +269,10 @@ def _default_score(data: Dict[str, Any]) -> float:
     return 0.0
 
 class BullCallSpread(Strategy):
+    __slots__ = ()
     phase = 2
-    @classmethod
-    def score(cls, data: Dict[str, Any]) -> float:
+    @staticmethod
+    def score(data: Dict[str, Any]) -> float:
         """
         Score Bull Call Spread: bullish trend (+2) and low IV (+1).
         """
@@ -215,12 +280,16 @@ class BullCallSpread(Strategy):
         momentum = data.get('momentum')
         iv = data.get('iv', 0.0)
         iv_th = data.get('iv_threshold', 0.25)
-        score = 0.0
-        if trend == 'bullish' and momentum == 'positive':
-            score += 2.0
-        if iv < iv_th:
-            score += 1.0
-        return score
+        return float(2 * (trend == 'bullish' and momentum == 'positive') + (iv < iv_th))
+
+    @classmethod
+    def score_batch(cls, batch: Dict[str, np.ndarray]) -> np.ndarray:
+        aligned = (batch['trend'] == 1) & (batch['momentum'] == 1)
+        return 2.0 * aligned + (batch['iv'] < batch['iv_threshold'])
+
+    @staticmethod
+    def leg_count(data: Dict[str, Any]) -> int:
+        return 2 * (data.get('trend') == 'bullish')
 
     def run(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -228,39 +297,20 @@ class BullCallSpread(Strategy):
         """
         trend = data.get('trend')
         if trend != 'bullish':
-            logging.info(f"BullCallSpread: trend not bullish ({trend}); no orders.")
+            logger.info("BullCallSpread: trend not bullish (%s); no orders.", trend)
             return []
         ticker = data['ticker']
         price = data['price']
         expiration = data['expiration']  # type: date
-        atm = round(price)
-        width = 2
-        buy_strike = atm
-        sell_strike = atm + width
-        orders: List[Dict[str, Any]] = []
-        legs = [
-            (buy_strike, 'call', 'buy'),
-            (sell_strike, 'call', 'sell'),
-        ]
-        for strike, opt_type, side in legs:
-            if strike <= 0:
-                logging.error("Invalid strike for BullCallSpread: %s", strike)
-                continue
-            symbol = format_option_symbol(ticker, expiration, strike, opt_type)
-            order = {
-                'symbol': symbol,
-                'qty': 1,
-                'side': side,
-                'type': 'market',
-                'time_in_force': 'day'
-            }
-            orders.append(order)
-            logging.info(f"BullCallSpread leg {opt_type} {side}: {order}")
-        return orders
+        atm = _atm_strike(price)
+        return _materialize_legs('BullCallSpread', ticker, expiration, atm, _BULL_CALL_LEGS, all_or_nothing=False)
 
 class BearPutSpread(Strategy):
-    @classmethod
-    def score(cls, data: Dict[str, Any]) -> float:
+    __slots__ = ()
+    phase = 2
+
+    @staticmethod
+    def score(data: Dict[str, Any]) -> float:
         """
         Score Bear Put Spread: bearish trend (+2) and low IV (+1).
         """
@@ -268,12 +318,16 @@ class BearPutSpread(Strategy):
         momentum = data.get('momentum')
         iv = data.get('iv', 0.0)
         iv_th = data.get('iv_threshold', 0.25)
-        score = 0.0
-        if trend == 'bearish' and momentum == 'negative':
-            score += 2.0
-        if iv < iv_th:
-            score += 1.0
-        return score
+        return float(2 * (trend == 'bearish' and momentum == 'negative') + (iv < iv_th))
+
+    @classmethod
+    def score_batch(cls, batch: Dict[str, np.ndarray]) -> np.ndarray:
+        aligned = (batch['trend'] == -1) & (batch['momentum'] == -1)
+        return 2.0 * aligned + (batch['iv'] < batch['iv_threshold'])
+
+    @staticmethod
+    def leg_count(data: Dict[str, Any]) -> int:
+        return 2 * (data.get('trend') == 'bearish')
 
     def run(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -281,55 +335,41 @@ class BearPutSpread(Strategy):
         """
         trend = data.get('trend')
         if trend != 'bearish':
-            logging.info(f"BearPutSpread: trend not bearish ({trend}); no orders.")
+            logger.info("BearPutSpread: trend not bearish (%s); no orders.", trend)
             return []
         ticker = data['ticker']
         price = data['price']
         expiration = data['expiration']  # type: date
-        atm = round(price)
-        width = 2
-        buy_strike = atm
-        sell_strike = atm - width
-        orders: List[Dict[str, Any]] = []
-        legs = [
-            (buy_strike, 'put', 'buy'),
-            (sell_strike, 'put', 'sell'),
-        ]
-        for strike, opt_type, side in legs:
-            if strike <= 0:
-                logging.error("Invalid strike for BearPutSpread: %s", strike)
-                continue
-            symbol = format_option_symbol(ticker, expiration, strike, opt_type)
-            order = {
-                'symbol': symbol,
-                'qty': 1,
-                'side': side,
-                'type': 'market',
-                'time_in_force': 'day'
-            }
-            orders.append(order)
-            logging.info(f"BearPutSpread leg {opt_type} {side}: {order}")
-        return orders
+        atm = _atm_strike(price)
+        return _materialize_legs('BearPutSpread', ticker, expiration, atm, _BEAR_PUT_LEGS, all_or_nothing=False)
+
+# CalendarSpread far leg sits one weekly expiration past the near leg
+_WEEK = timedelta(days=7)
 
 class CalendarSpread(Strategy):
+    __slots__ = ()
     phase = 2
 
-    @classmethod
-    def score(cls, data: Dict[str, Any]) -> float:
+    @staticmethod
+    def score(data: Dict[str, Any]) -> float:
         """
         Score Calendar Spread: neutral trend (+2); add +1 for low IV or (for bearish) high IV.
         """
         trend = data.get('trend')
         iv = data.get('iv', 0.0)
         iv_th = data.get('iv_threshold', 0.25)
-        score = 0.0
-        # Trend bias
-        if trend == 'neutral':
-            score += 2.0
-        # IV bias: low IV always +1; high IV favorable if bearish
-        if iv < iv_th or (trend == 'bearish' and iv >= iv_th):
-            score += 1.0
-        return score
+        # Trend bias (+2) plus IV bias: low IV always +1; high IV favorable if bearish
+        return float(2 * (trend == 'neutral') + (iv < iv_th or (trend == 'bearish' and iv >= iv_th)))
+
+    @classmethod
+    def score_batch(cls, batch: Dict[str, np.ndarray]) -> np.ndarray:
+        trend, low_iv = batch['trend'], batch['iv'] < batch['iv_threshold']
+        high_iv = batch['iv'] >= batch['iv_threshold']
+        return 2.0 * (trend == 0) + (low_iv | ((trend == -1) & high_iv))
+
+    @staticmethod
+    def leg_count(data: Dict[str, Any]) -> int:
+        return 2 * (data.get('trend') == 'neutral')
 
     def run(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -337,51 +377,56 @@ class CalendarSpread(Strategy):
         """
         trend = data.get('trend')
         if trend != 'neutral':
-            logging.info(f"CalendarSpread: trend not neutral ({trend}); no orders.")
+            logger.info("CalendarSpread: trend not neutral (%s); no orders.", trend)
             return []
         ticker = data['ticker']
         price = data['price']
         near_exp = data['expiration']  # type: date
-        far_exp = near_exp + timedelta(days=7)
-        atm = round(price)
-        orders: List[Dict[str, Any]] = []
-        legs = [
-            (atm, 'call', 'buy', far_exp),
-            (atm, 'call', 'sell', near_exp),
-        ]
-        for strike, opt_type, side, exp in legs:
-            if strike <= 0:
-                logging.error("Invalid strike for CalendarSpread: %s", strike)
-                continue
-            symbol = format_option_symbol(ticker, exp, strike, opt_type)
-            order = {
-                'symbol': symbol,
-                'qty': 1,
-                'side': side,
-                'type': 'market',
-                'time_in_force': 'day'
-            }
-            orders.append(order)
-            logging.info(f"CalendarSpread leg {opt_type} {side} exp={exp}: {order}")
+        far_exp = near_exp + _WEEK
+        atm = _atm_strike(price)
+        # Both legs share the ATM strike, so they are valid or invalid together
+        if atm <= 0:
+            logger.error("Invalid strike for CalendarSpread: %s", atm)
+            return []
+        legs = (
+            (atm, CALL, BUY, far_exp),
+            (atm, CALL, SELL, near_exp),
+        )
+        orders = [_build_order(format_option_symbol(ticker, exp, strike, opt_type), side)
+                  for strike, opt_type, side, exp in legs]
+        if logger.isEnabledFor(logging.INFO):
+            for (_, opt_type, side, exp), order in zip(legs, orders):
+                logger.info("CalendarSpread leg %s %s exp=%s: %s", opt_type, side, exp, order)
         return orders
 
+# IronButterfly legs (width 2), lowest strike first: (strike offset from ATM, option type, side)
+_IB_LEGS = ((-2, PUT, BUY), (0, PUT, SELL), (0, CALL, SELL), (2, CALL, BUY))
+
 class IronButterfly(Strategy):
-    @classmethod
-    def score(cls, data: Dict[str, Any]) -> float:
+    __slots__ = ()
+    phase = 2
+
+    @staticmethod
+    def score(data: Dict[str, Any]) -> float:
         """
         Score Iron Butterfly: neutral trend (+2); +1 for IV alignment (high for bullish/neutral, low for bearish).
         """
         trend = data.get('trend')
         iv = data.get('iv', 0.0)
         iv_th = data.get('iv_threshold', 0.25)
-        score = 0.0
-        # Trend bias
-        if trend == 'neutral':
-            score += 2.0
-        # IV bias: high IV benefits bullish/neutral, low IV benefits bearish
-        if (trend != 'bearish' and iv >= iv_th) or (trend == 'bearish' and iv < iv_th):
-            score += 1.0
-        return score
+        # Trend bias (+2) plus IV bias: high IV benefits bullish/neutral, low IV benefits bearish
+        return float(2 * (trend == 'neutral')
+                     + ((trend != 'bearish' and iv >= iv_th) or (trend == 'bearish' and iv < iv_th)))
+
+    @classmethod
+    def score_batch(cls, batch: Dict[str, np.ndarray]) -> np.ndarray:
+        trend, low_iv = batch['trend'], batch['iv'] < batch['iv_threshold']
+        high_iv = batch['iv'] >= batch['iv_threshold']
+        return 2.0 * (trend == 0) + (((trend != -1) & high_iv) | ((trend == -1) & low_iv))
+
+    @staticmethod
+    def leg_count(data: Dict[str, Any]) -> int:
+        return 4 * (data.get('trend') == 'neutral')
 
     def run(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -390,42 +435,29 @@ class IronButterfly(Strategy):
         """
         trend = data.get('trend')
         if trend != 'neutral':
-            logging.info(f"IronButterfly: trend not neutral ({trend}); no orders.")
+            logger.info("IronButterfly: trend not neutral (%s); no orders.", trend)
             return []
         ticker = data['ticker']
         price = data['price']
         expiration = data['expiration']  # type: date
-        atm = round(price)
-        width = 2
-        legs = [
-            (atm - width, 'put', 'buy'),
-            (atm, 'put', 'sell'),
-            (atm, 'call', 'sell'),
-            (atm + width, 'call', 'buy'),
-        ]
-        orders: List[Dict[str, Any]] = []
-        for strike, opt_type, side in legs:
-            if strike <= 0:
-                logging.error("Invalid strike for IronButterfly: %s", strike)
-                continue
-            symbol = format_option_symbol(ticker, expiration, strike, opt_type)
-            order = {
-                'symbol': symbol,
-                'qty': 1,
-                'side': side,
-                'type': 'market',
-                'time_in_force': 'day'
-            }
-            orders.append(order)
-            logging.info(f"IronButterfly leg {opt_type} {side}: {order}")
-        return orders
+        atm = _atm_strike(price)
+        return _materialize_legs('IronButterfly', ticker, expiration, atm, _IB_LEGS)
 
 class GammaScalping(Strategy):
+    __slots__ = ()
     phase = 2
-    @classmethod
-    def score(cls, data: Dict[str, Any]) -> float:
+    @staticmethod
+    def score(data: Dict[str, Any]) -> float:
         return _default_score(data)
 
+    @classmethod
+    def score_batch(cls, batch: Dict[str, np.ndarray]) -> np.ndarray:
+        return np.zeros(len(batch['trend']))
+
+    @staticmethod
+    def leg_count(data: Dict[str, Any]) -> int:
+        return 2
+
     def run(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Gamma Scalping: buy ATM call and put (straddle) to capture gamma when momentum is neutral to positive.
@@ -433,414 +465,359 @@ class GammaScalping(Strategy):
         ticker = data['ticker']
         price = data['price']
         expiration = data['expiration']  # type: date
-        atm = round(price)
+        atm = _atm_strike(price)
         # Buy straddle
-        orders: List[Dict[str, Any]] = []
-        for opt_type in ('call', 'put'):
-            symbol = format_option_symbol(ticker, expiration, atm, opt_type)
-            order = {
-                'symbol': symbol,
-                'qty': 1,
-                'side': 'buy',
-                'type': 'market',
-                'time_in_force': 'day'
-            }
-            orders.append(order)
-            logging.info(f"GammaScalping {opt_type} buy: {order}")
-        return orders
+        return _materialize_legs('GammaScalping', ticker, expiration, atm, _GAMMA_LEGS)
 
 class Wheel(Strategy):
+    __slots__ = ()
     phase = 2
     """
     Wheel strategy: cash-secured put: sell one OTM put when trend is bullish and momentum is positive.
     """
-    @classmethod
-    def score(cls, data: Dict[str, Any]) -> float:
+    @staticmethod
+    def score(data: Dict[str, Any]) -> float:
         trend = data.get('trend')
         momentum = data.get('momentum')
         iv = data.get('iv', 0.0)
         iv_th = data.get('iv_threshold', 0.25)
-        score = 0.0
-        if trend == 'bullish' and momentum == 'positive':
-            score += 2.0
         # Benefit from higher IV when selling premium
-        if iv >= iv_th:
-            score += 1.0
-        return score
+        return float(2 * (trend == 'bullish' and momentum == 'positive') + (iv >= iv_th))
+
+    @classmethod
+    def score_batch(cls, batch: Dict[str, np.ndarray]) -> np.ndarray:
+        aligned = (batch['trend'] == 1) & (batch['momentum'] == 1)
+        return 2.0 * aligned + (batch['iv'] >= batch['iv_threshold'])
+
+    @staticmethod
+    def leg_count(data: Dict[str, Any]) -> int:
+        return int(data.get('trend') == 'bullish' and data.get('momentum') == 'positive')
 
     def run(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         trend = data.get('trend')
         momentum = data.get('momentum')
         if trend != 'bullish' or momentum != 'positive':
-            logging.info(f"Wheel: requires bullish trend and positive momentum; got {trend}, {momentum}")
+            logger.info("Wheel: requires bullish trend and positive momentum; got %s, %s", trend, momentum)
             return []
         ticker = data['ticker']
         price = data['price']
         expiration = data['expiration']  # type: date
-        atm = round(price)
+        atm = _atm_strike(price)
         width = 2  # OTM distance
         strike = atm - width
         if strike <= 0:
-            logging.error(f"Wheel: invalid strike {strike}")
+            logger.error("Wheel: invalid strike %s", strike)
             return []
-        symbol = format_option_symbol(ticker, expiration, strike, 'put')
-        order = {
-            'symbol': symbol,
-            'qty': 1,
-            'side': 'sell',
-            'type': 'market',
-            'time_in_force': 'day'
-        }
-        logging.info(f"Wheel sell put: {order}")
+        order = _single_leg(ticker, expiration, strike, PUT, SELL)
+        logger.info("Wheel sell put: %s", order)
         return [order]
 
 class ZeroDTE(Strategy):
+    __slots__ = ()
     phase = 2
     """
     Zero-Day-To-Expiration strategy: buy ATM call on positive momentum or ATM put on negative momentum on expiration day.
     """
-    @classmethod
-    def score(cls, data: Dict[str, Any]) -> float:
+    @staticmethod
+    def score(data: Dict[str, Any]) -> float:
         exp = data.get('expiration')  # type: date
-        today = date.today()
+        # Callers scoring a whole watchlist pass 'today' once; otherwise use the cached clock
+        today = data.get('today') or today_cached()
         iv = data.get('iv', 0.0)
         iv_th = data.get('iv_threshold', 0.25)
         momentum = data.get('momentum')
-        score = 0.0
         # Only score on expiration day
-        if exp == today:
-            if momentum in ('positive', 'negative'):
-                score += 2.0
-            if iv < iv_th:
-                score += 1.0
-        return score
+        return float(exp == today and 2 * (momentum in ('positive', 'negative')) + (iv < iv_th))
+
+    @staticmethod
+    def leg_count(data: Dict[str, Any]) -> int:
+        return int(data.get('expiration') == (data.get('today') or today_cached())
+                   and data.get('momentum') in ('positive', 'negative'))
 
     def run(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         exp = data.get('expiration')  # type: date
-        today = date.today()
+        today = data.get('today') or today_cached()
         if exp != today:
-            logging.info(f"ZeroDTE: not expiration day ({exp}); no orders.")
+            logger.info("ZeroDTE: not expiration day (%s); no orders.", exp)
             return []
         ticker = data['ticker']
         price = data['price']
-        atm = round(price)
+        atm = _atm_strike(price)
         momentum = data.get('momentum')
         if momentum == 'positive':
-            opt_type = 'call'
+            opt_type = CALL
         elif momentum == 'negative':
-            opt_type = 'put'
+            opt_type = PUT
         else:
-            logging.info(f"ZeroDTE: neutral momentum; no orders.")
+            logger.info("ZeroDTE: neutral momentum; no orders.")
             return []
-        symbol = format_option_symbol(ticker, exp, atm, opt_type)
-        order = {
-            'symbol': symbol,
-            'qty': 1,
-            'side': 'buy',
-            'type': 'market',
-            'time_in_force': 'day'
-        }
-        logging.info(f"ZeroDTE buy {opt_type}: {order}")
+        order = _single_leg(ticker, exp, atm, opt_type)
+        logger.info("ZeroDTE buy %s: %s", opt_type, order)
         return [order]
 
 
 class Strangle(Strategy):
+    __slots__ = ()
     phase = 2
     """
     Strangle strategy: buy OTM call and put when trend is neutral and IV is low.
     """
-    @classmethod
-    def score(cls, data: Dict[str, Any]) -> float:
+    @staticmethod
+    def score(data: Dict[str, Any]) -> float:
         trend = data.get('trend')
         iv = data.get('iv', 0.0)
         iv_th = data.get('iv_threshold', 0.25)
-        score = 0.0
-        if trend == 'neutral':
-            score += 1.0
-            if iv < iv_th:
-                score += 1.0
-        return score
+        return float(trend == 'neutral' and 1 + (iv < iv_th))
+
+    @classmethod
+    def score_batch(cls, batch: Dict[str, np.ndarray]) -> np.ndarray:
+        neutral = batch['trend'] == 0
+        return neutral * (1.0 + (batch['iv'] < batch['iv_threshold']))
+
+    @staticmethod
+    def leg_count(data: Dict[str, Any]) -> int:
+        return 2 * (data.get('trend') == 'neutral')
 
     def run(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         trend = data.get('trend')
         if trend != 'neutral':
-            logging.info(f"Strangle: requires neutral trend; got {trend}")
+            logger.info("Strangle: requires neutral trend; got %s", trend)
             return []
         ticker = data['ticker']
         price = data['price']
         expiration = data['expiration']  # type: date
-        atm = round(price)
-        width = 2  # OTM distance
-        call_strike = atm + width
-        put_strike = atm - width
-        if put_strike <= 0:
-            logging.error(f"Strangle: invalid put strike {put_strike}")
-            return []
-        orders: List[Dict[str, Any]] = []
-        legs = [
-            (put_strike, 'put', 'buy'),
-            (call_strike, 'call', 'buy'),
-        ]
-        for strike, opt_type, side in legs:
-            symbol = format_option_symbol(ticker, expiration, strike, opt_type)
-            order = {
-                'symbol': symbol,
-                'qty': 1,
-                'side': side,
-                'type': 'market',
-                'time_in_force': 'day'
-            }
-            orders.append(order)
-            logging.info(f"Strangle {opt_type} buy: {order}")
-        return orders
+        atm = _atm_strike(price)
+        return _materialize_legs('Strangle', ticker, expiration, atm, _STRANGLE_LEGS)
 
 
 class ShortStraddle(Strategy):
+    __slots__ = ()
     phase = 2
     """
     Short Straddle strategy: sell ATM call and put when trend is neutral and IV is high.
     """
-    @classmethod
-    def score(cls, data: Dict[str, Any]) -> float:
+    @staticmethod
+    def score(data: Dict[str, Any]) -> float:
         trend = data.get('trend')
         iv = data.get('iv', 0.0)
         iv_th = data.get('iv_threshold', 0.25)
-        score = 0.0
-        if trend == 'neutral':
-            score += 1.0
-            if iv >= iv_th:
-                score += 1.0
-        return score
+        return float(trend == 'neutral' and 1 + (iv >= iv_th))
+
+    @classmethod
+    def score_batch(cls, batch: Dict[str, np.ndarray]) -> np.ndarray:
+        neutral = batch['trend'] == 0
+        return neutral * (1.0 + (batch['iv'] >= batch['iv_threshold']))
+
+    @staticmethod
+    def leg_count(data: Dict[str, Any]) -> int:
+        return 2 * (data.get('trend') == 'neutral')
 
     def run(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         trend = data.get('trend')
         if trend != 'neutral':
-            logging.info(f"ShortStraddle: requires neutral trend; got {trend}")
+            logger.info("ShortStraddle: requires neutral trend; got %s", trend)
             return []
         ticker = data['ticker']
         price = data['price']
         expiration = data['expiration']  # type: date
-        atm = round(price)
-        orders: List[Dict[str, Any]] = []
-        for opt_type in ['put', 'call']:
-            symbol = format_option_symbol(ticker, expiration, atm, opt_type)
-            order = {
-                'symbol': symbol,
-                'qty': 1,
-                'side': 'sell',
-                'type': 'market',
-                'time_in_force': 'day'
-            }
-            orders.append(order)
-            logging.info(f"ShortStraddle {opt_type} sell: {order}")
-        return orders
+        atm = _atm_strike(price)
+        return _materialize_legs('ShortStraddle', ticker, expiration, atm, _SHORT_STRADDLE_LEGS)
 
 
 class CoveredCall(Strategy):
+    __slots__ = ()
     phase = 2
     """
     Covered Call strategy: sell ATM call when trend is bullish and momentum is positive, and IV is high.
     """
-    @classmethod
-    def score(cls, data: Dict[str, Any]) -> float:
+    @staticmethod
+    def score(data: Dict[str, Any]) -> float:
         trend = data.get('trend')
         momentum = data.get('momentum')
         iv = data.get('iv', 0.0)
         iv_th = data.get('iv_threshold', 0.25)
-        score = 0.0
-        if trend == 'bullish' and momentum == 'positive':
-            score += 2.0
-        if iv >= iv_th:
-            score += 1.0
-        return score
+        return float(2 * (trend == 'bullish' and momentum == 'positive') + (iv >= iv_th))
+
+    @classmethod
+    def score_batch(cls, batch: Dict[str, np.ndarray]) -> np.ndarray:
+        aligned = (batch['trend'] == 1) & (batch['momentum'] == 1)
+        return 2.0 * aligned + (batch['iv'] >= batch['iv_threshold'])
+
+    @staticmethod
+    def leg_count(data: Dict[str, Any]) -> int:
+        return int(data.get('trend') == 'bullish' and data.get('momentum') == 'positive')
 
     def run(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         trend = data.get('trend')
         momentum = data.get('momentum')
         if trend != 'bullish' or momentum != 'positive':
-            logging.info(f"CoveredCall: requires bullish positive momentum; got {trend}, {momentum}")
+            logger.info("CoveredCall: requires bullish positive momentum; got %s, %s", trend, momentum)
             return []
         ticker = data['ticker']
         price = data['price']
         expiration = data['expiration']  # type: date
-        atm = round(price)
-        symbol = format_option_symbol(ticker, expiration, atm, 'call')
-        order = {
-            'symbol': symbol,
-            'qty': 1,
-            'side': 'sell',
-            'type': 'market',
-            'time_in_force': 'day'
-        }
-        logging.info(f"CoveredCall sell call: {order}")
+        atm = _atm_strike(price)
+        order = _single_leg(ticker, expiration, atm, CALL, SELL)
+        logger.info("CoveredCall sell call: %s", order)
         return [order]
 
 
 class ProtectivePut(Strategy):
+    __slots__ = ()
     phase = 2
     """
     Protective Put strategy: buy ATM put when trend is bearish and momentum is negative, and IV is high.
     """
-    @classmethod
-    def score(cls, data: Dict[str, Any]) -> float:
+    @staticmethod
+    def score(data: Dict[str, Any]) -> float:
         trend = data.get('trend')
         momentum = data.get('momentum')
         iv = data.get('iv', 0.0)
         iv_th = data.get('iv_threshold', 0.25)
-        score = 0.0
-        if trend == 'bearish' and momentum == 'negative':
-            score += 2.0
-        if iv >= iv_th:
-            score += 1.0
-        return score
+        return float(2 * (trend == 'bearish' and momentum == 'negative') + (iv >= iv_th))
+
+    @classmethod
+    def score_batch(cls, batch: Dict[str, np.ndarray]) -> np.ndarray:
+        aligned = (batch['trend'] == -1) & (batch['momentum'] == -1)
+        return 2.0 * aligned + (batch['iv'] >= batch['iv_threshold'])
+
+    @staticmethod
+    def leg_count(data: Dict[str, Any]) -> int:
+        return int(data.get('trend') == 'bearish' and data.get('momentum') == 'negative')
 
     def run(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         trend = data.get('trend')
         momentum = data.get('momentum')
         if trend != 'bearish' or momentum != 'negative':
-            logging.info(f"ProtectivePut: requires bearish negative momentum; got {trend}, {momentum}")
+            logger.info("ProtectivePut: requires bearish negative momentum; got %s, %s", trend, momentum)
             return []
         ticker = data['ticker']
         price = data['price']
         expiration = data['expiration']  # type: date
-        atm = round(price)
-        symbol = format_option_symbol(ticker, expiration, atm, 'put')
-        order = {
-            'symbol': symbol,
-            'qty': 1,
-            'side': 'buy',
-            'type': 'market',
-            'time_in_force': 'day'
-        }
-        logging.info(f"ProtectivePut buy put: {order}")
+        atm = _atm_strike(price)
+        order = _single_leg(ticker, expiration, atm, PUT)
+        logger.info("ProtectivePut buy put: %s", order)
         return [order]
 
 
 
 
 class RatioBackspread(Strategy):
+    __slots__ = ()
     phase = 2
     """
     Ratio Backspread strategy: sell 1 ATM option and buy 2 OTM options when directional trend and low IV.
     Supports calls on bullish momentum, puts on bearish momentum.
     """
-    @classmethod
-    def score(cls, data: Dict[str, Any]) -> float:
+    @staticmethod
+    def score(data: Dict[str, Any]) -> float:
         trend = data.get('trend')
         momentum = data.get('momentum')
         iv = data.get('iv', 0.0)
         iv_th = data.get('iv_threshold', 0.25)
-        score = 0.0
-        # directional move
-        if trend == 'bullish' and momentum == 'positive':
-            score += 2.0
-        elif trend == 'bearish' and momentum == 'negative':
-            score += 2.0
-        # buy when IV low
-        if iv < iv_th:
-            score += 1.0
-        return score
+        # directional move (+2), buy when IV low (+1)
+        return float(2 * ((trend == 'bullish' and momentum == 'positive')
+                          or (trend == 'bearish' and momentum == 'negative'))
+                     + (iv < iv_th))
+
+    @classmethod
+    def score_batch(cls, batch: Dict[str, np.ndarray]) -> np.ndarray:
+        # Trend and momentum codes share signs, so equal nonzero codes mean a directional move
+        directional = (batch['trend'] == batch['momentum']) & (batch['trend'] != 0)
+        return 2.0 * directional + (batch['iv'] < batch['iv_threshold'])
+
+    @staticmethod
+    def leg_count(data: Dict[str, Any]) -> int:
+        return 3 * (data.get('momentum') in ('positive', 'negative'))
 
     def run(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         momentum = data.get('momentum')
         ticker = data['ticker']
         price = data['price']
         expiration = data['expiration']  # type: date
-        atm = round(price)
-        width = 2
-        orders: List[Dict[str, Any]] = []
-        if momentum == 'positive':
-            # call backspread
-            sell_strike = atm
-            buy_strike = atm + width
-            legs = [
-                (sell_strike, 'call', 'sell'),
-                (buy_strike, 'call', 'buy'),
-                (buy_strike, 'call', 'buy'),
-            ]
-        elif momentum == 'negative':
-            # put backspread
-            sell_strike = atm
-            buy_strike = atm - width
-            if buy_strike <= 0:
-                logging.error(f"RatioBackspread: invalid put strike {buy_strike}")
-                return []
-            legs = [
-                (sell_strike, 'put', 'sell'),
-                (buy_strike, 'put', 'buy'),
-                (buy_strike, 'put', 'buy'),
-            ]
-        else:
-            logging.info(f"RatioBackspread: requires directional momentum; got {momentum}")
+        atm = _atm_strike(price)
+        # call backspread on positive momentum, put backspread on negative
+        legs = _RATIO_LEGS.get(momentum)
+        if legs is None:
+            logger.info("RatioBackspread: requires directional momentum; got %s", momentum)
             return []
-        for strike, opt_type, side in legs:
-            symbol = format_option_symbol(ticker, expiration, strike, opt_type)
-            order = {
-                'symbol': symbol,
-                'qty': 1,
-                'side': side,
-                'type': 'market',
-                'time_in_force': 'day'
-            }
-            orders.append(order)
-            logging.info(f"RatioBackspread {opt_type} {side}: {order}")
-        return orders
+        return _materialize_legs('RatioBackspread', ticker, expiration, atm, legs)
 
 
 class Collar(Strategy):
+    __slots__ = ()
     phase = 2
     """
     Collar strategy: buy protective put and sell covered call when trend is neutral and IV is high.
     """
-    @classmethod
-    def score(cls, data: Dict[str, Any]) -> float:
+    @staticmethod
+    def score(data: Dict[str, Any]) -> float:
         trend = data.get('trend')
         iv = data.get('iv', 0.0)
         iv_th = data.get('iv_threshold', 0.25)
-        score = 0.0
-        if trend == 'neutral':
-            score += 2.0
-        if iv >= iv_th:
-            score += 1.0
-        return score
+        return float(2 * (trend == 'neutral') + (iv >= iv_th))
+
+    @classmethod
+    def score_batch(cls, batch: Dict[str, np.ndarray]) -> np.ndarray:
+        return 2.0 * (batch['trend'] == 0) + (batch['iv'] >= batch['iv_threshold'])
+
+    @staticmethod
+    def leg_count(data: Dict[str, Any]) -> int:
+        return 2 * (data.get('trend') == 'neutral')
 
     def run(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
         trend = data.get('trend')
         if trend != 'neutral':
-            logging.info(f"Collar: requires neutral trend; got {trend}")
+            logger.info("Collar: requires neutral trend; got %s", trend)
             return []
         ticker = data['ticker']
         price = data['price']
         expiration = data['expiration']  # type: date
-        atm = round(price)
-        width = 2
-        put_strike = atm - width
-        call_strike = atm + width
-        if put_strike <= 0:
-            logging.error(f"Collar: invalid put strike {put_strike}")
-            return []
-        orders: List[Dict[str, Any]] = []
-        # sell call
-        symbol_call = format_option_symbol(ticker, expiration, call_strike, 'call')
-        orders.append({
-            'symbol': symbol_call,
-            'qty': 1,
-            'side': 'sell',
-            'type': 'market',
-            'time_in_force': 'day'
-        })
-        logging.info(f"Collar sell call: {orders[-1]}")
-        # buy put
-        symbol_put = format_option_symbol(ticker, expiration, put_strike, 'put')
-        orders.append({
-            'symbol': symbol_put,
-            'qty': 1,
-            'side': 'buy',
-            'type': 'market',
-            'time_in_force': 'day'
-        })
-        logging.info(f"Collar buy put: {orders[-1]}")
-        return orders
+        atm = _atm_strike(price)
+        return _materialize_legs('Collar', ticker, expiration, atm, _COLLAR_LEGS)
 
 
+def _all_subclasses(root):
+    """
+    Every subclass of `root` (depth-first, in definition order), without scanning module globals.
+    """
+    found = []
+    seen = set()
+    stack = list(reversed(root.__subclasses__()))
+    while stack:
+        cls = stack.pop()
+        if cls in seen:
+            continue
+        seen.add(cls)
+        found.append(cls)
+        stack.extend(reversed(cls.__subclasses__()))
+    return found
+
+
+# Registry of concrete strategies in declaration order
+STRATEGIES = tuple(_all_subclasses(Strategy))
+
+# Strategies grouped by the phase that introduces them
+PHASE1 = tuple(cls for cls in STRATEGIES if cls.phase == 1)
+PHASE2 = tuple(cls for cls in STRATEGIES if cls.phase == 2)
+
+# Name -> (score, run) callables. Strategies are stateless, so one shared instance
+# per class serves every call and callers skip per-ticker instantiation.
+STRATEGY_FUNCS = {cls.__name__: (cls.score, cls().run) for cls in STRATEGIES}
+
+def score_matrix(batch: Dict[str, np.ndarray], classes=STRATEGIES) -> np.ndarray:
+    """
+    Stack each class's score_batch into an (n_strategies, n_tickers) float matrix.
+    """
+    return np.vstack([np.asarray(cls.score_batch(batch), dtype=np.float64) for cls in classes])
 
+def select_batch(batch: Dict[str, np.ndarray]) -> List[type]:
+    """
+    Pick the phase-1 strategy class for every ticker in the batch.
+    Matches StrategySelector(phase=1): highest score wins, ties go to the
+    lexicographically highest class name.
+    """
+    # Name-descending order makes argmax's first-max rule implement the tie-break
+    classes = sorted(PHASE1, key=lambda c: c.__name__, reverse=True)
+    winners = np.argmax(score_matrix(batch, classes), axis=0)
+    return [classes[i] for i in winners]
@@ -1,8 +1,19 @@
 import logging
-import inspect
 import strategies
-from datetime import date
-from strategies import Strategy as _Strategy
+from utils import today_cached
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=8)
+def _discover_strategies(phase: int):
+    """
+    Registered strategy classes with phase <= `phase`, in declaration order.
+    Cached per phase; call _discover_strategies.cache_clear() if strategies is reloaded.
+    """
+    return tuple(cls for cls in strategies.STRATEGIES if cls.phase <= phase)
+
 
 class StrategySelector:
     """
@@ -10,82 +21,115 @@ class StrategySelector:
 
     phase: integer phase threshold; only strategies with phase <= this are considered.
     iv_threshold: threshold for IV-based scoring.
+
+    Both are read-only after construction: the candidate classes, the scoring
+    template and the memoized choices are built from them. Create a new selector
+    to use a different threshold or phase.
     """
     def __init__(self, iv_threshold: float = 0.25, phase: int = 1):
         """Initialize selector with an IV threshold and maximum phase to include."""
-        self.iv_threshold = iv_threshold
-        self.phase = phase
+        self._iv_threshold = iv_threshold
+        self._phase = phase
+        # Candidate classes are fixed for the selector's lifetime
+        self._strategy_classes = _discover_strategies(phase)
+        # Class names for the tie-break sort keys
+        self._names = {cls: cls.__name__ for cls in self._strategy_classes}
+        # Fields every select() shares; the dummy ticker/price/expiration stand in for
+        # the market data that score()/leg_count() may read
+        self._data_template = {
+            'ticker': 'DUMMY',
+            'price': 100.0,
+            'expiration': None,
+            'iv_threshold': iv_threshold,
+        }
+        # (trend, momentum, iv bucket) -> (chosen class, its score); see select()
+        self._choices = {}
+
+    @property
+    def iv_threshold(self) -> float:
+        return self._iv_threshold
+
+    @property
+    def phase(self) -> int:
+        return self._phase
 
     def select(self, trend: str, iv: float, momentum: str):
         """
         Given market metrics, select and return the best Strategy instance.
         """
-        logging.info(f"Selecting strategy: trend={trend}, iv={iv:.2f}, momentum={momentum}")
-        # Build data dict for scoring
-        data = {
-            'trend': trend,
-            'iv': iv,
-            'momentum': momentum,
-            'iv_threshold': self.iv_threshold,
-            # Dummy fields for tie-breaker run
-            'ticker': 'DUMMY',
-            'price': 100.0,
-            'expiration': date.today(),
-            'trend': trend,
-            'iv': iv,
-            'momentum': momentum,
-            'iv_threshold': self.iv_threshold,
-        }
-        # Discover all Strategy subclasses up to this.phase
-        strategy_classes = [
-            obj for obj in vars(strategies).values()
-            if inspect.isclass(obj)
-            and issubclass(obj, _Strategy)
-            and obj is not _Strategy
-            and getattr(obj, 'phase', 1) <= self.phase
-        ]
-        # Compute scores
-        scores = {}
-        for cls in strategy_classes:
+        logger.info("Selecting strategy: trend=%s, iv=%.2f, momentum=%s", trend, iv, momentum)
+        # Registered scores and tie-breaks only read iv through its comparison with
+        # iv_threshold, so both comparisons (NaN fails both) key the choice exactly
+        try:
+            key = (trend, momentum, iv < self.iv_threshold, iv >= self.iv_threshold)
+        except TypeError:
+            key = None
+        cached = self._choices.get(key)
+        if cached is not None:
+            best_cls, best_score = cached
+            logger.info("Chosen strategy: %s with score %.2f (cached)", best_cls.__name__, best_score)
+            return best_cls()
+        # Build data dict for scoring from the per-selector template
+        data = self._data_template.copy()
+        data['trend'] = trend
+        data['iv'] = iv
+        data['momentum'] = momentum
+        data['expiration'] = today_cached()
+        # Score the registered strategies up to this.phase, tracking the top score
+        # and every class that reaches it in the same pass
+        best_score = float('-inf')
+        best_classes = []
+        for cls in self._strategy_classes:
             try:
                 score = cls.score(data)
             except Exception as e:
-                logging.warning(f"Failed to score strategy {cls.__name__}: {e}")
+                logger.warning("Failed to score strategy %s: %s", cls.__name__, e)
                 score = float('-inf')
-            scores[cls] = score
-            logging.debug(f"Score for {cls.__name__}: {score}")
-                        # Determine best-scoring strategy with tie-breaker
-        best_score = max(scores.values())
-        # Find all strategy classes with the top score
-        best_classes = [cls for cls, s in scores.items() if s == best_score]
+            logger.debug("Score for %s: %s", cls.__name__, score)
+            if score > best_score:
+                best_score = score
+                best_classes = [cls]
+            elif score == best_score:
+                best_classes.append(cls)
         if len(best_classes) > 1:
             # Phase-based tie-breaker
             if self.phase > 1:
                 # Special tie-breaker for neutral trend & high IV: prefer Collar
                 if trend == 'neutral' and iv >= self.iv_threshold and strategies.Collar in best_classes:
+                    if key is not None:
+                        self._choices[key] = (strategies.Collar, best_score)
                     return strategies.Collar()
-                # For phase 2+, break ties by number of legs (run output length)
-                # Safely run each candidate (catch missing data) and compare number of orders
-                runs = {}
-                for cls in best_classes:
+                # For phase 2+, break ties by number of legs, then alphabetically by class name.
+                # leg_count answers from each candidate's entry conditions instead of running it.
+                def tie_key(cls):
                     try:
-                        orders = cls().run(data)
+                        legs = cls.leg_count(data)
                     except Exception as e:
-                        logging.warning(f"Error running strategy {cls.__name__} for tie-breaker: {e}")
-                        orders = []
-                    runs[cls] = orders
-                max_legs = max(len(orders) for orders in runs.values())
-                leg_winners = [cls for cls, orders in runs.items() if len(orders) == max_legs]
-                if len(leg_winners) == 1:
-                    best_cls = leg_winners[0]
-                else:
-                    # Fallback to alphabetical order of class name
-                    best_cls = sorted(leg_winners, key=lambda c: c.__name__)[0]
+                        logger.warning("Error counting legs of %s for tie-breaker: %s", cls.__name__, e)
+                        legs = 0
+                    return -legs, self._names[cls]
+                best_cls = min(best_classes, key=tie_key)
             else:
                 # Tie-break alphabetically by class name (pick lexicographically highest)
-                best_cls = max(best_classes, key=lambda c: c.__name__)
-            logging.info(f"Tie between {[c.__name__ for c in best_classes]}, selecting {best_cls.__name__}")
+                best_cls = max(best_classes, key=self._names.__getitem__)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Tie between %s, selecting %s", [c.__name__ for c in best_classes], best_cls.__name__)
         else:
             best_cls = best_classes[0]
-        logging.info(f"Chosen strategy: {best_cls.__name__} with score {best_score:.2f}")
+        logger.info("Chosen strategy: %s with score %.2f", best_cls.__name__, best_score)
+        if key is not None:
+            self._choices[key] = (best_cls, best_score)
         return best_cls()
+
+    def select_batch(self, rows):
+        """
+        Select a Strategy instance for each dict of 'trend', 'iv' and 'momentum' in rows.
+        Phase 1 scores the whole universe at once with score_batch and takes the argmax
+        per row; later phases break ties with leg_count() and the Collar preference,
+        which score_batch does not model, so they fall back to select().
+        """
+        if self.phase > 1:
+            return [self.select(r['trend'], r['iv'], r['momentum']) for r in rows]
+        batch = strategies.encode_batch(rows, iv_threshold=self.iv_threshold)
+        batch['iv_threshold'][:] = self.iv_threshold
+        return [cls() for cls in strategies.select_batch(batch)]
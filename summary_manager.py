@@ -1,8 +1,23 @@
 import os
 import smtplib
 import logging
+from collections import Counter
 from datetime import date
 from email.mime.text import MIMEText
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_fixed
+
+def _fill_notional(result):
+    """
+    filled_avg_price * filled_qty for one order result; 0.0 if either is missing or non-numeric.
+    """
+    try:
+        return float(result.filled_avg_price) * float(result.filled_qty)
+    except Exception:
+        return 0.0
+
+# Connection-level SMTP failures worth retrying; anything else is permanent
+_TRANSIENT_SMTP_ERRORS = (smtplib.SMTPConnectError, smtplib.SMTPServerDisconnected,
+                          ConnectionError, TimeoutError)
 
 class SummaryManager:
     """
@@ -35,10 +50,7 @@ class SummaryManager:
 
     def get_summary(self):
         total_trades = len(self.trades)
-        by_strategy = {}
-        for t in self.trades:
-            name = t['strategy']
-            by_strategy[name] = by_strategy.get(name, 0) + 1
+        by_strategy = Counter(t['strategy'] for t in self.trades)
 
         lines = [f"Daily Trade Summary for {date.today()}",
                  f"Total trades executed: {total_trades}",
@@ -46,22 +58,46 @@ class SummaryManager:
         for strat, count in by_strategy.items():
             lines.append(f"- {strat}: {count} trades")
         # Calculate total notional executed if available
-        total_notional = 0.0
-        for t in self.trades:
-            for r in t.get('results', []):
-                filled_price = getattr(r, 'filled_avg_price', None)
-                filled_qty = getattr(r, 'filled_qty', None)
-                try:
-                    price = float(filled_price)
-                    qty = float(filled_qty)
-                    total_notional += price * qty
-                except Exception:
-                    continue
+        total_notional = sum(_fill_notional(r) for t in self.trades for r in t.get('results', []))
         if total_notional:
             lines.append(f"Total notional traded: {total_notional:.2f}")
         return "\n".join(lines)
 
 
+    def _connect(self):
+        """
+        Open an SMTP connection, upgrade it with STARTTLS and log in if credentials are set.
+        """
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port)
+        try:
+            server.starttls()
+            if self.smtp_username and self.smtp_password:
+                server.login(self.smtp_username, self.smtp_password)
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    @retry(retry=retry_if_exception_type(_TRANSIENT_SMTP_ERRORS),
+           stop=stop_after_attempt(3), wait=wait_fixed(2), reraise=True)
+    def _deliver(self, msg):
+        """
+        Send msg to all recipients in one sendmail() over a single connection.
+        Only connection-level failures are retried; rejections such as bad
+        credentials or refused recipients are raised immediately.
+        """
+        server = self._connect()
+        try:
+            server.sendmail(self.email_sender, self.email_recipients, msg.as_string())
+        except Exception:
+            server.close()
+            raise
+        # The message has been accepted; a failed QUIT must not trigger a resend
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+
     def send_summary_email(self):
         summary = self.get_summary()
         if not self.smtp_server or not self.email_recipients:
@@ -72,12 +108,7 @@ class SummaryManager:
         msg['From'] = self.email_sender
         msg['To'] = ",".join(self.email_recipients)
         try:
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()
-            if self.smtp_username and self.smtp_password:
-                server.login(self.smtp_username, self.smtp_password)
-            server.sendmail(self.email_sender, self.email_recipients, msg.as_string())
-            server.quit()
+            self._deliver(msg)
             logging.info("Daily summary email sent successfully")
             # Clear recorded trades after sending summary
             self.trades.clear()
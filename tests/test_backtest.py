@@ -109,3 +109,70 @@ def test_run_backtest_insufficient_bars(bars, expected_records, monkeypatch):
     assert isinstance(df, pd.DataFrame)
     # Should be empty DataFrame
     assert df.empty
+
+
+def test_main_returns_net_pl(monkeypatch, tmp_path):
+    results_file = tmp_path / 'results.csv'
+    # Non-empty results trigger the equity simulation
+    monkeypatch.setattr(backtest, 'run_backtest', lambda **kwargs: pd.DataFrame([{'pl': 1.0}]))
+    monkeypatch.setattr(backtest, 'simulate_equity', lambda csv, start, end, capital: 250.0)
+    net_pl = backtest.main([
+        '--tickers', 'FAKE', '--start', '2025-04-01', '--end', '2025-05-30',
+        '--results-file', str(results_file),
+    ])
+    assert net_pl == 250.0
+    # No trades yields zero P/L without simulating equity
+    monkeypatch.setattr(backtest, 'run_backtest', lambda **kwargs: pd.DataFrame())
+    assert backtest.main(['--tickers', 'FAKE', '--start', '2025-04-01', '--end', '2025-05-30']) == 0.0
+
+
+def test_main_end_to_end_net_pl(monkeypatch, tmp_path):
+    # Real run_backtest -> results CSV -> simulate_equity, with bars from a stubbed cache
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv('ALPACA_API_KEY', 'AK')
+    monkeypatch.setenv('ALPACA_SECRET_KEY', 'SK')
+    monkeypatch.delenv('SKIP_OPTION_PRICES', raising=False)
+
+    class FakeOptionClient:
+        def __init__(self, **kwargs):
+            self.prices = iter([2.0, 3.0])  # entry close, then exit close
+        def get_option_bars(self, req):
+            return {req.symbol_or_symbols[0]: [FakeBar(c=next(self.prices), t=None)]}
+
+    monkeypatch.setattr(backtest, 'OptionHistoricalDataClient', FakeOptionClient)
+    def no_fetch(client, ticker, start, end):
+        raise AssertionError("bars should come from the cache")
+    monkeypatch.setattr(backtest, 'get_bars', no_fetch)
+    bars = [FakeBar(c=100.0 + i, t=datetime.datetime(2025,5,1)) for i in range(21)]
+    cache = {('FAKE', datetime.datetime(2025,4,1), datetime.datetime(2025,5,30)): bars}
+    net_pl = backtest.main([
+        '--tickers', 'FAKE', '--start', '2025-04-01', '--end', '2025-05-30',
+        '--results-file', str(tmp_path / 'results.csv'),
+    ], bars_cache=cache)
+    # One bought contract from 2.0 to 3.0 at a 100 multiplier
+    assert net_pl == 100.0
+
+
+def test_run_backtest_reuses_cached_bars(monkeypatch, tmp_path):
+    calls = []
+    bars = [FakeBar(c=100.0 + i, t=datetime.datetime(2025,5,1)) for i in range(21)]
+    def counting_get_bars(client, ticker, start, end):
+        calls.append(ticker)
+        return bars
+    monkeypatch.setattr(backtest, 'get_bars', counting_get_bars)
+    cache = {}
+    for iv_threshold in (0.2, 0.5):
+        df = backtest.run_backtest(
+            tickers=['FAKE'],
+            start_date=datetime.datetime(2025,4,1),
+            end_date=datetime.datetime(2025,5,30),
+            api_key='AK',
+            secret_key='SK',
+            base_url='url',
+            data_url=None,
+            iv_threshold=iv_threshold,
+            results_file=str(tmp_path / 'results.csv'),
+            bars_cache=cache
+        )
+        assert df.shape[0] == 2
+    assert calls == ['FAKE']
@@ -0,0 +1,22 @@
+from enums import Trend, Momentum, OptType
+
+
+def test_from_label_round_trips_and_defaults_to_neutral():
+    for member in Trend:
+        assert Trend.from_label(member.label) is member
+        assert Trend.from_label(member) is member
+    for member in Momentum:
+        assert Momentum.from_label(member.label) is member
+    assert Trend.from_label('sideways') is Trend.NEUTRAL
+    assert Momentum.from_label(None) is Momentum.NEUTRAL
+    assert Trend.BULLISH == 1 and Momentum.NEGATIVE == -1
+
+
+def test_opt_type_formats_as_label_and_matches_string_symbols():
+    from datetime import date
+    from utils import format_option_symbol
+    assert f"{OptType.CALL}" == str(OptType.CALL) == 'call'
+    exp = date(2025, 1, 17)
+    for member in OptType:
+        assert format_option_symbol('XYZ', exp, 100, member) == \
+            format_option_symbol('XYZ', exp, 100, member.label)
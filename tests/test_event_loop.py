@@ -7,14 +7,18 @@ class DummyScheduler:
     def __init__(self, timezone=None):
         self.timezone = timezone
         self.jobs = []
-    def add_job(self, func, trigger, args=None, day_of_week=None, hour=None, minute=None):
+        self.executors = {}
+    def add_executor(self, executor, alias='default'):
+        self.executors[alias] = executor
+    def add_job(self, func, trigger, args=None, day_of_week=None, hour=None, minute=None, executor='default'):
         self.jobs.append({
             'func': func,
             'trigger': trigger,
             'args': args,
             'day_of_week': day_of_week,
             'hour': hour,
-            'minute': minute
+            'minute': minute,
+            'executor': executor
         })
     def start(self):
         pass
@@ -49,3 +53,24 @@ async def test_event_loop_schedules_summary(monkeypatch):
     funcs = [job['func'] for job in sched.jobs]
     assert main.summary_manager.send_summary_email in funcs, \
         "Summary email job was not scheduled"
+    # Blocking SMTP delivery runs on its own thread pool, off the event loop
+    job = sched.jobs[funcs.index(main.summary_manager.send_summary_email)]
+    assert job['executor'] in sched.executors and job['executor'] != 'default'
+
+
+@pytest.mark.asyncio
+async def test_event_loop_clears_symbol_cache_before_open(monkeypatch):
+    scheduler_holder = {}
+    def fake_scheduler(timezone=None):
+        sched = DummyScheduler(timezone=timezone)
+        scheduler_holder['sched'] = sched
+        return sched
+    monkeypatch.setattr(main, 'AsyncIOScheduler', fake_scheduler)
+    monkeypatch.setattr(main, 'stream_listener', lambda *args, **kwargs: asyncio.sleep(0))
+
+    await main.event_loop(object(), object(), 'a', 'b', 'c', [])
+
+    jobs = [job for job in scheduler_holder['sched'].jobs
+            if job['func'] == main.format_option_symbol.cache_clear]
+    assert len(jobs) == 1
+    assert (jobs[0]['hour'], jobs[0]['minute']) == (9, 25)
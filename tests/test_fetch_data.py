@@ -0,0 +1,36 @@
+import os
+import sys
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+import fetch_data
+
+
+def _write(path, dates):
+    with open(path, 'w') as f:
+        f.write("Date,Open,High,Low,Close,Volume\n")
+        for d in dates:
+            f.write(f"{d},1,1,1,1,100\n")
+
+
+def test_is_valid_cache_requires_full_coverage(tmp_path):
+    path = str(tmp_path / 'SPY.csv')
+    start, end = datetime(2025, 1, 6), datetime(2025, 1, 31)
+    _write(path, ['2025-01-06', '2025-01-31'])
+    assert fetch_data._is_valid_cache(path, start, end)
+    # Stops halfway through the requested range
+    _write(path, ['2025-01-06', '2025-01-15'])
+    assert not fetch_data._is_valid_cache(path, start, end)
+    # Weekend edges: range starts on a Saturday and ends on a Sunday
+    _write(path, ['2025-01-06', '2025-01-31'])
+    assert fetch_data._is_valid_cache(path, datetime(2025, 1, 4), datetime(2025, 2, 2))
+
+
+def test_fetch_ticker_skips_cache_for_open_ended_range(tmp_path):
+    bar = SimpleNamespace(timestamp=datetime(2025, 1, 6), open=1.0, high=1.0, low=1.0, close=1.0, volume=100)
+    client = SimpleNamespace(get_stock_bars=lambda req: {'SPY': [bar]})
+    start = datetime(2025, 1, 6)
+    end = datetime.now() + timedelta(days=1)
+    fetch_data.fetch_ticker(client, 'SPY', start, end, str(tmp_path))
+    assert sorted(os.listdir(tmp_path)) == ['SPY.csv']
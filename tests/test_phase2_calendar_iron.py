@@ -81,4 +81,9 @@ def test_iron_butterfly_run_neutral(trend):
 def test_iron_butterfly_run_non_neutral(trend):
     data = {'ticker': TICKER, 'price': PRICE, 'expiration': EXP_DATE, 'trend': trend}
     strat = IronButterfly()
-    assert strat.run(data) == []
\ No newline at end of file
+    assert strat.run(data) == []
+
+
+def test_iron_butterfly_run_rejects_nonpositive_wing():
+    data = {'ticker': TICKER, 'price': 2.0, 'expiration': EXP_DATE, 'trend': 'neutral'}
+    assert IronButterfly().run(data) == []
@@ -80,3 +80,10 @@ def test_ratio_backspread_run_non_directional():
     data = sample_run_data('neutral')
     orders = RatioBackspread().run(data)
     assert orders == []
+
+
+def test_ratio_backspread_run_rejects_non_positive_atm():
+    # A sub-0.5 price puts the short ATM call at strike 0: no partial position
+    data = sample_run_data('positive')
+    data['price'] = 0.4
+    assert RatioBackspread().run(data) == []
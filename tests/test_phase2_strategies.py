@@ -53,3 +53,14 @@ def test_phase2_strategy_smoke_score_and_run(cls):
         assert isinstance(order, dict)
         for key in ('symbol', 'qty', 'side', 'type', 'time_in_force'):
             assert key in order
+
+
+def test_zero_dte_uses_injected_today():
+    data = sample_data()
+    data['today'] = data['expiration']
+    assert ZeroDTE.score(data) == 3.0
+    orders = ZeroDTE().run(data)
+    assert [o['symbol'] for o in orders] == ['XYZ251017C00100000']
+    data['today'] = date(2025, 10, 16)
+    assert ZeroDTE.score(data) == 0.0
+    assert ZeroDTE().run(data) == []
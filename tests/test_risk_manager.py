@@ -1,7 +1,6 @@
 import logging
 import pytest
 from risk_manager import RiskManager
-from alpaca.trading.requests import StopLossRequest, TakeProfitRequest
 
 
 def test_empty_orders():
@@ -35,12 +34,11 @@ def test_adjust_single_buy_order():
     o = result[0]
     # Volatility-based sizing: factor = 1 - iv = 0.5, new_qty = int(4 * 0.5) = 2
     assert o['qty'] == 2
-    # Stop-loss and take-profit attached
-    assert isinstance(o.get('stop_loss'), StopLossRequest)
-    assert isinstance(o.get('take_profit'), TakeProfitRequest)
+    # Stop-loss and take-profit attached as plain prices
+    assert 'stop_loss' not in o and 'take_profit' not in o
     # Check price levels: stop at 90.0, profit at 120.0
-    assert o['stop_loss'].stop_price == 90.0
-    assert o['take_profit'].limit_price == 120.0
+    assert o['stop_loss_price'] == 90.0
+    assert o['take_profit_price'] == 120.0
     # Symbol and side preserved
     assert o['symbol'] == 'ABC' and o['side'] == 'buy'
 
@@ -57,9 +55,9 @@ def test_adjust_single_sell_order():
     # factor = 1 - iv = 0.8, new_qty = int(5 * 0.8) = 4
     assert o['qty'] == 4
     # Stop-loss for sell: price * (1 + stop_loss_pct) = 55.0
-    assert pytest.approx(o['stop_loss'].stop_price, rel=1e-6) == 55.0
+    assert pytest.approx(o['stop_loss_price'], rel=1e-6) == 55.0
     # Take-profit for sell: price * (1 - take_profit_pct) = 40.0
-    assert pytest.approx(o['take_profit'].limit_price, rel=1e-6) == 40.0
+    assert pytest.approx(o['take_profit_price'], rel=1e-6) == 40.0
 
 
 def test_volatility_sizing_floor():
@@ -84,8 +82,8 @@ def test_atr_based_dynamic_stops_buy():
     assert len(result) == 1
     o = result[0]
     # ATR = 10, stop = 200 - 2*10 = 180, profit = 200 + 3*10 = 230
-    assert o['stop_loss'].stop_price == 180.0
-    assert o['take_profit'].limit_price == 230.0
+    assert o['stop_loss_price'] == 180.0
+    assert o['take_profit_price'] == 230.0
 
 
 def test_atr_based_dynamic_stops_sell():
@@ -97,8 +95,8 @@ def test_atr_based_dynamic_stops_sell():
     result = rm.adjust_orders([order], data)
     o = result[0]
     # ATR = 10, stop = 50 + 1*10 = 60, profit = 50 - 2*10 = 30
-    assert pytest.approx(o['stop_loss'].stop_price, rel=1e-6) == 60.0
-    assert pytest.approx(o['take_profit'].limit_price, rel=1e-6) == 30.0
+    assert pytest.approx(o['stop_loss_price'], rel=1e-6) == 60.0
+    assert pytest.approx(o['take_profit_price'], rel=1e-6) == 30.0
 
 
 def test_trailing_stop_flag_attached():
@@ -110,3 +108,17 @@ def test_trailing_stop_flag_attached():
     assert 'trailing_stop_pct' in o
     assert o['trailing_stop_pct'] == 0.05
 
+
+
+def test_compute_stops_falls_back_without_enough_closes():
+    from risk_manager import compute_stops
+    # Only 3 closes for a 14-bar ATR: percentage stops apply and atr is None
+    stop, profit, atr = compute_stops([1.0, 2.0, 3.0], 14, True, 100.0, 2.0, 3.0, 0.02, 0.04)
+    assert atr is None
+    assert stop == pytest.approx(98.0)
+    assert profit == pytest.approx(104.0)
+    # Enough closes: ATR over the trailing 2 changes only
+    stop, profit, atr = compute_stops([0.0, 100.0, 104.0, 100.0], 2, False, 100.0, 1.0, 1.0, 0.02, 0.04)
+    assert atr == pytest.approx(4.0)
+    assert stop == pytest.approx(104.0)
+    assert profit == pytest.approx(96.0)
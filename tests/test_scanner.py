@@ -92,3 +92,52 @@ def test_filtering_sorting_top_n(monkeypatch):
     result = s.scan()
     # Should filter B (iv=1.5) and sort by iv: C (0.3), A (0.5)
     assert result == ['C', 'A']
+
+
+def test_filtering_top_n_truncates_and_keeps_ties_stable(monkeypatch):
+    monkeypatch.setenv('ALPACA_API_KEY', 'k')
+    monkeypatch.setenv('ALPACA_SECRET_KEY', 's')
+    monkeypatch.delenv('TICKERS', raising=False)
+    monkeypatch.setenv('SCANNER_CACHE_TTL', '0')
+    monkeypatch.setenv('SCANNER_TOP_N', '2')
+    class FakeAsset:
+        def __init__(self, symbol):
+            self.symbol = symbol
+            self.status = 'active'
+            self.tradable = True
+    class FakeClient:
+        def __init__(self, *args, **kwargs): pass
+        def get_all_assets(self, status, asset_class):
+            return [FakeAsset(s) for s in 'ABCD']
+    monkeypatch.setattr(scanner, 'TradingClient', FakeClient)
+    market = {
+        'A': {'iv': 0.4, 'trend': 'bullish'},
+        'B': {'iv': 0.2, 'trend': 'bearish'},
+        'C': {'iv': 0.4, 'trend': 'bullish'},
+        'D': {'iv': 0.1, 'trend': 'bullish'},
+    }
+    monkeypatch.setattr(scanner, 'get_market_data', lambda *args: market)
+    monkeypatch.setattr(scanner, 'get_iv', lambda d: d['iv'])
+    monkeypatch.setattr(scanner, 'get_trend', lambda d: d['trend'])
+    monkeypatch.setattr(scanner, 'get_momentum', lambda d: 'positive')
+    s = scanner.Scanner()
+    # B is bearish; D has the lowest IV; A wins the tie with C by input order
+    assert s.scan() == ['D', 'A']
+
+
+def test_stale_cache_by_mtime_is_ignored(monkeypatch, tmp_path):
+    monkeypatch.setenv('ALPACA_API_KEY', 'k')
+    monkeypatch.setenv('ALPACA_SECRET_KEY', 's')
+    cache_file = tmp_path / 'cache.json'
+    # Payload timestamp is fresh, but the file itself is old
+    cache_file.write_text(json.dumps({'timestamp': time.time(), 'tickers': ['X']}))
+    old = time.time() - 600
+    os.utime(cache_file, (old, old))
+    monkeypatch.setenv('SCANNER_CACHE_FILE', str(cache_file))
+    monkeypatch.setenv('SCANNER_CACHE_TTL', '300')
+    monkeypatch.setattr(scanner, 'TradingClient', lambda *args, **kwargs: None)
+    s = scanner.Scanner()
+    assert s._load_cache() is None
+    s._save_cache(['Y'])
+    assert s._load_cache() == ['Y']
+    assert not os.path.exists(str(cache_file) + '.tmp')
@@ -0,0 +1,43 @@
+import pandas as pd
+import pytest
+
+import simulate_equity as se
+
+
+@pytest.fixture(autouse=True)
+def run_in_tmp(monkeypatch, tmp_path):
+    # The equity curve PNG is written to the working directory
+    monkeypatch.chdir(tmp_path)
+
+
+def _write_results(path):
+    # Leg rows carry expiration/pl; run_backtest's per-bar summary rows do not
+    rows = [
+        {'entry_date': '2025-05-01', 'ticker': 'A', 'strategy': 'S', 'expiration': '2025-05-02', 'pl': 50.0},
+        {'entry_date': '2025-05-01', 'ticker': 'A', 'strategy': 'S', 'expiration': '2025-05-02', 'pl': -20.0},
+        {'entry_date': '2025-05-01', 'ticker': 'A', 'strategy': 'S', 'order_count': 2},
+        {'entry_date': '2025-05-05', 'ticker': 'B', 'strategy': 'S', 'expiration': '2025-05-09', 'pl': None},
+        {'entry_date': '2025-05-05', 'ticker': 'B', 'strategy': 'S', 'expiration': '2025-05-09', 'pl': 30.0},
+        {'entry_date': '2025-05-05', 'ticker': 'B', 'strategy': 'S', 'order_count': 2},
+    ]
+    pd.DataFrame(rows).to_csv(path, index=False)
+
+
+def test_simulate_equity_skips_summary_rows(tmp_path):
+    csv_path = tmp_path / 'results.csv'
+    _write_results(csv_path)
+    net_pl = se.simulate_equity(str(csv_path), '2025-05-01', '2025-06-01', 1000.0)
+    # Daily sums as the groupby over pl_date computed them
+    df = pd.read_csv(csv_path, parse_dates=['entry_date', 'expiration'])
+    df['pl_date'] = df['expiration'].dt.date
+    df['pl'] = pd.to_numeric(df['pl'], errors='coerce').fillna(0.0)
+    daily = df.groupby('pl_date')['pl'].sum()
+    assert list(daily) == [30.0, 30.0]
+    assert net_pl == pytest.approx(daily.sum())
+
+
+def test_simulate_equity_only_summary_rows(tmp_path):
+    csv_path = tmp_path / 'results.csv'
+    pd.DataFrame([{'entry_date': '2025-05-01', 'ticker': 'A', 'strategy': 'S', 'order_count': 1,
+                   'expiration': None, 'pl': None}]).to_csv(csv_path, index=False)
+    assert se.simulate_equity(str(csv_path), '2025-05-01', '2025-06-01', 1000.0) == 0.0
@@ -69,3 +69,81 @@ def test_vertical_spread(trend, strikes):
         suffix = ( 'C' if trend!='bearish' else 'P' ) + f"{int(strike*1000):08d}"
         assert order['symbol'].endswith(suffix)
 
+
+
+def test_score_batch_matches_scalar_score():
+    from itertools import product
+    from strategies import encode_batch, STRATEGIES
+    rows = [
+        {'trend': t, 'momentum': m, 'iv': iv, 'iv_threshold': 0.25}
+        for t, m, iv in product(['bullish', 'neutral', 'bearish'],
+                                ['positive', 'neutral', 'negative'],
+                                [0.1, 0.25, 0.4])
+    ]
+    batch = encode_batch(rows)
+    # Vectorized overrides plus the base-class fallback (ZeroDTE needs an expiration)
+    for cls in STRATEGIES:
+        scores = cls.score_batch(batch)
+        assert list(scores) == [cls.score(r) for r in rows]
+
+
+def test_strategy_funcs_match_class_methods():
+    from strategies import STRATEGIES, STRATEGY_FUNCS
+    assert list(STRATEGY_FUNCS) == [cls.__name__ for cls in STRATEGIES]
+    data = {'ticker': TICKER, 'price': PRICE, 'expiration': EXP_DATE,
+            'trend': 'neutral', 'momentum': 'positive', 'iv': 0.3, 'iv_threshold': 0.25}
+    score, run = STRATEGY_FUNCS['IronCondor']
+    assert score(data) == IronCondor.score(data)
+    assert run(data) == IronCondor().run(data)
+
+
+def test_phase_tables_partition_strategies():
+    from strategies import STRATEGIES, PHASE1, PHASE2
+    assert set(PHASE1) | set(PHASE2) == set(STRATEGIES)
+    assert [c.__name__ for c in PHASE1] == ['LongCall', 'LongPut', 'Straddle', 'IronCondor', 'VerticalSpread']
+    assert [c.__name__ for c in PHASE2][:4] == ['BullCallSpread', 'BearPutSpread', 'CalendarSpread', 'IronButterfly']
+
+
+def test_all_subclasses_walks_nested_classes_in_order():
+    from strategies import _all_subclasses
+
+    class Root: pass
+    class A(Root): pass
+    class B(Root): pass
+    class A1(A): pass
+    class AB(A, B): pass
+
+    assert _all_subclasses(Root) == [A, A1, AB, B]
+
+
+def test_leg_count_matches_run_output():
+    from itertools import product
+    from datetime import date
+    from strategies import STRATEGIES
+    today = date.today()
+    for cls, trend, momentum, exp in product(STRATEGIES, ['bullish', 'neutral', 'bearish'],
+                                             ['positive', 'neutral', 'negative'], [today, EXP_DATE]):
+        data = {'ticker': 'DUMMY', 'price': 100.0, 'expiration': exp, 'today': today,
+                'trend': trend, 'momentum': momentum, 'iv': 0.3, 'iv_threshold': 0.25}
+        assert cls.leg_count(data) == len(cls().run(data)), (cls.__name__, trend, momentum)
+
+
+def test_atm_strike_shared_across_phases():
+    from datetime import date
+    from strategies import LongCall, CoveredCall
+    data = {'ticker': 'XYZ', 'price': 100.5, 'expiration': date(2025, 10, 17),
+            'trend': 'bullish', 'momentum': 'positive'}
+    long_call = LongCall().run(data)[0]['symbol']
+    covered_call = CoveredCall().run(data)[0]['symbol']
+    assert long_call == covered_call == 'XYZ251017C00101000'
+
+
+def test_multi_leg_structures_are_all_or_nothing():
+    from datetime import date
+    from strategies import IronCondor, Strangle, Collar
+    data = {'ticker': 'XYZ', 'price': 3.0, 'expiration': date(2025, 10, 17), 'trend': 'neutral'}
+    # Only the lowest put strike is invalid; no partial structure is returned
+    assert IronCondor().run(data) == []
+    data['price'] = 2.0
+    assert Strangle().run(data) == []
+    assert Collar().run(data) == []
@@ -12,4 +12,62 @@ from strategies import LongCall, LongPut, Straddle, IronCondor, VerticalSpread
 def test_select_strategy(trend, iv, momentum, expected_cls):
     selector = StrategySelector(iv_threshold=0.25)
     strategy = selector.select(trend, iv, momentum)
-    assert isinstance(strategy, expected_cls)
\ No newline at end of file
+    assert isinstance(strategy, expected_cls)
+
+def test_select_batch_matches_phase1_selector():
+    from itertools import product
+    from strategies import encode_batch, select_batch
+    rows = [
+        {'trend': t, 'momentum': m, 'iv': iv, 'iv_threshold': 0.25}
+        for t, m, iv in product(['bullish', 'neutral', 'bearish'],
+                                ['positive', 'neutral', 'negative'],
+                                [0.1, 0.25, 0.4])
+    ]
+    selector = StrategySelector(iv_threshold=0.25)
+    expected = [type(selector.select(r['trend'], r['iv'], r['momentum'])) for r in rows]
+    assert select_batch(encode_batch(rows)) == expected
+
+
+def test_selector_select_batch_matches_select():
+    from itertools import product
+    rows = [
+        {'trend': t, 'momentum': m, 'iv': iv}
+        for t, m, iv in product(['bullish', 'neutral', 'bearish'],
+                                ['positive', 'neutral', 'negative'],
+                                [0.1, 0.25, 0.4])
+    ]
+    for phase in (1, 2):
+        selector = StrategySelector(iv_threshold=0.25, phase=phase)
+        picked = [type(s) for s in selector.select_batch(rows)]
+        assert picked == [type(selector.select(r['trend'], r['iv'], r['momentum'])) for r in rows]
+
+
+def test_discover_strategies_is_cached_per_phase():
+    import strategies
+    from strategy_selector import _discover_strategies
+    assert _discover_strategies(1) == strategies.PHASE1
+    assert _discover_strategies(2) == strategies.STRATEGIES
+    assert _discover_strategies(1) is _discover_strategies(1)
+
+
+def test_cached_choice_matches_fresh_selector():
+    from itertools import product
+    for phase in (1, 2):
+        shared = StrategySelector(iv_threshold=0.25, phase=phase)
+        for _ in range(2):
+            for t, m, iv in product(['bullish', 'neutral', 'bearish'],
+                                    ['positive', 'neutral', 'negative'],
+                                    [0.1, 0.2499, 0.25, 0.4, float('nan')]):
+                fresh = StrategySelector(iv_threshold=0.25, phase=phase)
+                assert type(shared.select(t, iv, m)) is type(fresh.select(t, iv, m))
+        # One entry per (trend, momentum) and each of low/high/NaN IV
+        assert len(shared._choices) == 27
+
+
+def test_selector_threshold_and_phase_are_read_only():
+    selector = StrategySelector(iv_threshold=0.25, phase=2)
+    assert selector.iv_threshold == 0.25 and selector.phase == 2
+    with pytest.raises(AttributeError):
+        selector.iv_threshold = 0.5
+    with pytest.raises(AttributeError):
+        selector.phase = 1
@@ -31,6 +31,8 @@ class DummySMTP:
         self.msg = msg
     def quit(self):
         pass
+    def close(self):
+        self.closed = True
 
 import logging
 
@@ -110,3 +112,22 @@ def test_send_summary_email_no_config(monkeypatch, caplog):
     assert "SMTP settings or recipients not configured" in caplog.text
     # trades should remain unchanged
     assert sm.trades != []
+
+
+def test_send_summary_email_auth_failure_not_retried(monkeypatch):
+    class RejectingSMTP(DummySMTP):
+        def login(self, username, password):
+            raise smtplib.SMTPAuthenticationError(535, b'bad credentials')
+
+    monkeypatch.setattr(smtplib, 'SMTP', RejectingSMTP)
+    monkeypatch.setenv('SMTP_SERVER', 'smtp.test')
+    monkeypatch.setenv('SMTP_USERNAME', 'user')
+    monkeypatch.setenv('SMTP_PASSWORD', 'wrong')
+    monkeypatch.setenv('EMAIL_RECIPIENTS', 'a@test')
+    sm = SummaryManager()
+    sm.trades = [{'symbol': 'A', 'strategy': 'S', 'orders': [], 'results': [], 'data': {}}]
+    sm.send_summary_email()
+    # One connection attempt, closed after the failed login; trades are kept
+    assert len(DummySMTP.instances) == 1
+    assert DummySMTP.instances[0].closed is True
+    assert sm.trades != []
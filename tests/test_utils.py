@@ -95,4 +95,35 @@ def test_get_market_data(monkeypatch):
     result = get_market_data(['FOO'], 'key', 'secret', None)
     assert 'FOO' in result
     assert result['FOO']['price'] == 123.45
-    assert result['FOO']['close_prices'] == [100.0, 110.0, 105.0]
\ No newline at end of file
+    assert result['FOO']['close_prices'] == [100.0, 110.0, 105.0]
+
+def test_today_cached_matches_today():
+    from datetime import date
+    from utils import today_cached
+    assert today_cached() == date.today()
+    # Repeated calls within the same minute reuse the cached date object
+    assert today_cached() is today_cached()
+
+def test_get_rolling_metrics_matches_scalar_helpers():
+    from utils import get_rolling_metrics
+    closes = list(100 + np.cumsum(np.random.default_rng(0).normal(size=40)))
+    ivs, trends, momenta = get_rolling_metrics(closes, window=20)
+    assert ivs[:19] == [None] * 19
+    for i in range(19, len(closes)):
+        window = closes[i - 19:i + 1]
+        assert ivs[i] == pytest.approx(get_iv({'close_prices': window}))
+        assert trends[i] == get_trend({'close_prices': window, 'price': closes[i]})
+        assert momenta[i] == get_momentum({'close_prices': window})
+
+def test_occ_root_and_symbol_match_formatter():
+    from datetime import date
+    from utils import build_occ_root, occ_symbol, format_option_symbol
+    exp = date(2024, 1, 19)
+    root = build_occ_root('AAPL', exp)
+    assert root == 'AAPL240119'
+    assert occ_symbol(root, 182.5, 'put') == format_option_symbol('AAPL', exp, 182.5, 'put')
+
+def test_strike_digits_table_matches_formatting():
+    from utils import _strike_digits
+    for strike in (0, 1, 99, 2000, 2001, 182.5, 100.0, -1):
+        assert _strike_digits(strike) == f"{int(strike * 1000):08d}"
@@ -1,8 +1,11 @@
 import os
+import time
 import requests
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
 from datetime import date, timedelta
+from functools import lru_cache
 
 
 def get_market_data(tickers, api_key, secret_key, base_url, data_url=None):
@@ -100,6 +103,43 @@ def get_momentum(data):
         return 'neutral'
     return 'positive' if close_prices[-1] > close_prices[-2] else 'negative'
 
+_TREND_LABELS = ('bearish', 'neutral', 'bullish')  # by 1 + sign(price - ma)
+_MOMENTUM_LABELS = ('negative', 'positive')  # by last > prev
+
+def get_rolling_metrics(close_prices, window=20):
+    """
+    Vectorized get_iv/get_trend/get_momentum for every trailing `window` of closes,
+    using the last close of each window as the price.
+    Returns (iv, trend, momentum) lists aligned with close_prices; entries before
+    the first full window are None.
+    """
+    closes = np.asarray(close_prices, dtype=np.float64)
+    n = closes.size
+    pad = [None] * min(n, window - 1)
+    if n < window:
+        return list(pad), list(pad), list(pad)
+    log_returns = np.diff(np.log(closes))
+    iv = np.std(sliding_window_view(log_returns, window - 1), axis=1) * np.sqrt(252)
+    ma = sliding_window_view(closes, window).mean(axis=1)
+    last = closes[window - 1:]
+    prev = closes[window - 2:-1]
+    # Index label tuples rather than np.where over strings: .tolist() of a str array
+    # builds fresh objects, while these are the same interned literals get_trend returns
+    trend_idx = 1 + (last > ma).astype(np.intp) - (last < ma)
+    trend = [_TREND_LABELS[i] for i in trend_idx.tolist()]
+    momentum = [_MOMENTUM_LABELS[i] for i in (last > prev).tolist()]
+    return pad + iv.tolist(), pad + trend, pad + momentum
+
+@lru_cache(maxsize=1)
+def _today_for_minute(minute):
+    return date.today()
+
+def today_cached():
+    """
+    Return today's date, re-reading the clock at most once per minute.
+    """
+    return _today_for_minute(int(time.monotonic() // 60))
+
 def get_next_friday(reference_date=None):
     """
     Return the next upcoming Friday date relative to reference_date (defaults to today).
@@ -111,16 +151,44 @@ def get_next_friday(reference_date=None):
         days_ahead += 7
     return ref + timedelta(days=days_ahead)
 
+# OCC strike field (strike * 1000, 8 digits) for whole-dollar strikes in the liquid range
+_STRIKE_DIGITS = tuple(f"{s * 1000:08d}" for s in range(2001))
+
+def _strike_digits(strike):
+    """OCC strike field; table lookup for int strikes 0-2000, formatted otherwise."""
+    if type(strike) is int and 0 <= strike <= 2000:
+        return _STRIKE_DIGITS[strike]
+    return f"{int(strike * 1000):08d}"
+
+def _type_letter(option_type):
+    """OCC type letter for an OptType member or a 'call'/'put' string."""
+    if isinstance(option_type, int):
+        return 'CP'[option_type]
+    return 'C' if option_type.lower() == 'call' else 'P'
+
+@lru_cache(maxsize=65536)
 def format_option_symbol(ticker, expiration_date, strike, option_type):
     """
     Format OCC option symbol: {ticker}{YYMMDD}{C/P}{strike*1000 padded 8 digits}.
     expiration_date: datetime.date
     strike: float
-    option_type: 'call' or 'put'
+    option_type: OptType or 'call'/'put'
+    Memoized: rounded strikes repeat heavily across bars and tickers.
     """
     exp_str = expiration_date.strftime('%y%m%d')
-    type_letter = 'C' if option_type.lower() == 'call' else 'P'
+    type_letter = _type_letter(option_type)
     # Alpaca expects strike * 1000, zero-padded to 8 digits
-    strike_int = int(strike * 1000)
-    strike_str = f"{strike_int:08d}"
+    strike_str = _strike_digits(strike)
     return f"{ticker}{exp_str}{type_letter}{strike_str}"
+
+def build_occ_root(ticker, expiration_date):
+    """
+    OCC symbol root shared by every leg on one underlying and expiration, e.g. 'AAPL240119'.
+    """
+    return f"{ticker}{expiration_date.strftime('%y%m%d')}"
+
+def occ_symbol(root, strike, option_type):
+    """
+    Complete an OCC symbol from build_occ_root() output; same format as format_option_symbol.
+    """
+    return f"{root}{_type_letter(option_type)}{_strike_digits(strike)}"